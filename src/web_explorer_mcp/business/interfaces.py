@@ -29,6 +29,10 @@ class WebSearchService(Protocol):
         """
         ...
 
+    async def stop(self) -> None:
+        """Release held resources such as HTTP connections."""
+        ...
+
 
 class WebpageContentService(Protocol):
     """Interface for webpage content extraction operations."""
@@ -39,6 +43,7 @@ class WebpageContentService(Protocol):
         raw_content: bool = False,
         timeout: int = 30,
         favor_precision: bool = True,
+        render: bool = True,
     ) -> WebpageContent:
         """
         Extract full content from webpage without pagination.
@@ -53,8 +58,14 @@ class WebpageContentService(Protocol):
             raw_content: Return raw HTML if True
             timeout: Request timeout in seconds
             favor_precision: Favor precision over recall in content extraction
+            render: Render the page in a browser if True; if False, use the
+                HTML as served over plain HTTP without running JavaScript
 
         Returns:
             WebpageContent with full extracted data or error
         """
         ...
+
+    async def stop(self) -> None:
+        """Release held resources such as browser connections."""
+        ...
@@ -1,5 +1,11 @@
 """Business logic services for web exploration operations."""
 
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from urllib.parse import urlparse
+
 from web_explorer_mcp.business.interfaces import WebpageContentService, WebSearchService
 from web_explorer_mcp.models.entities import SearchResponse, WebpageContent
 
@@ -45,10 +51,9 @@ def paginate_content(
     if page > total_pages:
         return ("", total_pages, False)
 
-    # Extract page content
+    # Extract page content with a single slice; slicing clamps the last page
     start_idx = (page - 1) * max_chars
-    end_idx = min(page * max_chars, total_chars)
-    page_text = content[start_idx:end_idx]
+    page_text = content[start_idx : start_idx + max_chars]
 
     # Add continuation indicator if not the last page
     if has_next_page:
@@ -57,6 +62,189 @@ def paginate_content(
     return (page_text, total_pages, has_next_page)
 
 
+class CachedWebpageContentService:
+    """
+    In-memory LRU cache with TTL in front of a WebpageContentService.
+
+    Successful extractions are stored per (url, raw_content, render) and served from
+    memory until they expire, so repeated requests for the same page skip the
+    browser round trip and parsing entirely. Error results are never cached.
+    """
+
+    def __init__(
+        self,
+        content_service: WebpageContentService,
+        max_entries: int = 128,
+        ttl_seconds: float = 300,
+    ):
+        self._content_service = content_service
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[
+            tuple[str, bool, bool], tuple[float, WebpageContent]
+        ] = OrderedDict()
+
+    async def extract_content(
+        self,
+        url: str,
+        raw_content: bool = False,
+        timeout: int = 30,
+        favor_precision: bool = True,
+        render: bool = True,
+    ) -> WebpageContent:
+        """
+        Return cached content for the URL or extract and cache it.
+
+        Args:
+            url: URL to extract content from
+            raw_content: Return raw HTML if True
+            timeout: Request timeout in seconds
+            favor_precision: Favor precision over recall in content extraction
+            render: Render the page in a browser if True, use static HTML if False
+
+        Returns:
+            WebpageContent with full extracted data or error
+        """
+        key = (url, raw_content, render)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() < expires_at:
+                self._cache.move_to_end(key)
+                # Deep copy so callers can edit any field, including the link,
+                # heading and image lists, without touching the cache
+                return cached.model_copy(deep=True)
+            del self._cache[key]
+
+        result = await self._content_service.extract_content(
+            url=url,
+            raw_content=raw_content,
+            timeout=timeout,
+            favor_precision=favor_precision,
+            render=render,
+        )
+
+        if result.error is None:
+            self._cache[key] = (time.monotonic() + self._ttl_seconds, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+            return result.model_copy(deep=True)
+
+        return result
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._cache.clear()
+
+    async def stop(self) -> None:
+        """Clear the cache and stop the wrapped service."""
+        self.clear()
+        await self._content_service.stop()
+
+
+class CachedWebSearchService:
+    """
+    In-memory LRU cache with TTL in front of a WebSearchService.
+
+    Successful searches are stored per (query, page), with the query stripped
+    of surrounding whitespace, and served from memory until they expire, so
+    repeated searches skip the SearxNG round trip. A search asking for fewer
+    results than the cached entry holds (or than the backend returned in
+    total) is answered by slicing the cached results, so only a larger
+    page_size goes back to the backend. Error results are never cached.
+    """
+
+    def __init__(
+        self,
+        search_service: WebSearchService,
+        max_entries: int = 256,
+        ttl_seconds: float = 300,
+    ):
+        self._search_service = search_service
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[tuple[str, int], tuple[float, SearchResponse]] = (
+            OrderedDict()
+        )
+
+    async def search(
+        self,
+        query: str,
+        page: int = 1,
+        page_size: int = 5,
+        timeout: int = 15,
+    ) -> SearchResponse:
+        """
+        Return cached results for the search or perform and cache it.
+
+        Args:
+            query: Search query string
+            page: Page number (1-based)
+            page_size: Number of results per page
+            timeout: Request timeout in seconds
+
+        Returns:
+            SearchResponse with results or error
+        """
+        key = (query.strip() if isinstance(query, str) else query, page)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if time.monotonic() >= expires_at:
+                del self._cache[key]
+            elif (
+                page_size <= cached.page_size
+                or len(cached.results) >= cached.total_results
+            ):
+                self._cache.move_to_end(key)
+                return self._sliced(cached, page_size)
+
+        result = await self._search_service.search(
+            query=query,
+            page=page,
+            page_size=page_size,
+            timeout=timeout,
+        )
+
+        if result.error is None:
+            self._cache[key] = (time.monotonic() + self._ttl_seconds, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+            return result.model_copy(deep=True)
+
+        return result
+
+    @staticmethod
+    def _sliced(cached: SearchResponse, page_size: int) -> SearchResponse:
+        """
+        Copy a cached response, keeping only the first page_size results.
+
+        Args:
+            cached: Cached search response
+            page_size: Number of results requested
+
+        Returns:
+            Deep copy of the response, so callers can edit it without touching the cache
+        """
+        return cached.model_copy(
+            update={
+                "page_size": page_size,
+                "results": [r.model_copy() for r in cached.results[:page_size]],
+            }
+        )
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._cache.clear()
+
+    async def stop(self) -> None:
+        """Clear the cache and stop the wrapped service."""
+        self.clear()
+        await self._search_service.stop()
+
+
 class WebExplorerService:
     """Main service for web exploration operations."""
 
@@ -64,9 +252,20 @@ class WebExplorerService:
         self,
         search_service: WebSearchService,
         content_service: WebpageContentService,
+        max_concurrency: int = 10,
+        max_concurrency_per_host: int = 4,
+        max_search_concurrency: int = 4,
     ):
         self._search_service = search_service
         self._content_service = content_service
+        self._search_semaphore = asyncio.Semaphore(max_search_concurrency)
+        self._extraction_semaphore = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency_per_host = max_concurrency_per_host
+        # Per-host semaphores shared by all batches; an entry disappears once
+        # no extraction for that host holds it, so the mapping stays small
+        self._host_semaphores: weakref.WeakValueDictionary[str, asyncio.Semaphore] = (
+            weakref.WeakValueDictionary()
+        )
 
     async def search_web(
         self,
@@ -94,11 +293,59 @@ class WebExplorerService:
             page_size=page_size,
         )
 
+    async def search_many_web(
+        self,
+        queries: list[str],
+        page: int = 1,
+        page_size: int | None = None,
+    ) -> list[SearchResponse]:
+        """
+        Run several web searches concurrently.
+
+        All queries go to the same search backend, so the number of searches
+        in flight is bounded by ``max_search_concurrency`` (shared with other
+        batches) to avoid flooding it.
+
+        Args:
+            queries: Search queries
+            page: Page number (1-based) requested for every query
+            page_size: Results per page (uses default if None)
+
+        Returns:
+            SearchResponse for each query, in the same order as ``queries``
+        """
+        if page_size is None:
+            page_size = 5  # Default from settings
+
+        async def search(query: str) -> SearchResponse:
+            async with self._search_semaphore:
+                return await self.search_web(
+                    query=query, page=page, page_size=page_size
+                )
+
+        results = await asyncio.gather(
+            *(search(query) for query in queries), return_exceptions=True
+        )
+
+        return [
+            SearchResponse(
+                query=query,
+                page=page,
+                page_size=page_size,
+                total_results=0,
+                error=f"Search error: {result}",
+            )
+            if isinstance(result, BaseException)
+            else result
+            for query, result in zip(queries, results, strict=True)
+        ]
+
     async def extract_webpage_content(
         self,
         url: str,
         raw_content: bool = False,
         timeout: int = 30,
+        render: bool = True,
     ) -> WebpageContent:
         """
         Extract full content from a webpage using Playwright.
@@ -110,6 +357,7 @@ class WebExplorerService:
             url: URL to extract from
             raw_content: Return raw HTML if True
             timeout: Request timeout in seconds
+            render: Render the page in a browser if True, use static HTML if False
 
         Returns:
             WebpageContent with full extracted data
@@ -118,4 +366,80 @@ class WebExplorerService:
             url=url,
             raw_content=raw_content,
             timeout=timeout,
+            render=render,
+        )
+
+    async def extract_many_webpage_contents(
+        self,
+        urls: list[str],
+        raw_content: bool = False,
+        timeout: int = 30,
+        render: bool = True,
+    ) -> list[WebpageContent]:
+        """
+        Extract content from several webpages concurrently.
+
+        The number of extractions in flight is bounded globally and per host,
+        both shared with other batches, so one domain is never hit with more
+        than ``max_concurrency_per_host`` parallel requests.
+
+        Args:
+            urls: URLs to extract from
+            raw_content: Return raw HTML if True
+            timeout: Request timeout in seconds
+            render: Render the pages in a browser if True, use static HTML if False
+
+        Returns:
+            WebpageContent for each URL, in the same order as ``urls``
+        """
+
+        async def extract(url: str) -> WebpageContent:
+            host_semaphore = self._host_semaphore(urlparse(url).netloc)
+            # Wait for the host slot before taking a global one, so URLs queued
+            # behind a busy host do not hold global slots other hosts could use
+            async with host_semaphore, self._extraction_semaphore:
+                return await self.extract_webpage_content(
+                    url=url, raw_content=raw_content, timeout=timeout, render=render
+                )
+
+        results = await asyncio.gather(
+            *(extract(url) for url in urls), return_exceptions=True
         )
+
+        return [
+            WebpageContent(
+                url=url,
+                title="",
+                description="",
+                author="",
+                published_date="",
+                main_content="",
+                content_type="webpage",
+                length=0,
+                error=f"Extraction error: {result}",
+            )
+            if isinstance(result, BaseException)
+            else result
+            for url, result in zip(urls, results, strict=True)
+        ]
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent extractions against a host.
+
+        Args:
+            host: Host (netloc) of the URL being extracted
+
+        Returns:
+            Semaphore shared by every batch currently extracting from the host
+        """
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_concurrency_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def stop(self) -> None:
+        """Stop the search and content services - call this on application shutdown."""
+        await self._search_service.stop()
+        await self._content_service.stop()
@@ -26,6 +26,19 @@ class WebSearchSettings(BaseModel):
         default=5, description="Default number of search results per page"
     )
     timeout: int = Field(default=15, description="HTTP request timeout in seconds")
+    max_concurrency: int = Field(
+        default=4, description="Maximum searches sent to SearxNG concurrently"
+    )
+    max_batch_queries: int = Field(
+        default=10, description="Maximum queries accepted by one batch search call"
+    )
+    cache_max_entries: int = Field(
+        default=256,
+        description="Maximum search results kept in the in-memory cache (0 disables caching)",
+    )
+    cache_ttl_seconds: int = Field(
+        default=300, description="Seconds a search result stays in the cache"
+    )
 
 
 class WebpageContentSettings(BaseModel):
@@ -35,6 +48,22 @@ class WebpageContentSettings(BaseModel):
     timeout: int = Field(
         default=15, description="HTTP request timeout in seconds for webpage fetching"
     )
+    max_concurrency: int = Field(
+        default=10, description="Maximum webpages extracted concurrently in a batch"
+    )
+    max_concurrency_per_host: int = Field(
+        default=4, description="Maximum concurrent extractions against a single host"
+    )
+    max_batch_urls: int = Field(
+        default=20, description="Maximum URLs accepted by one batch extraction call"
+    )
+    cache_max_entries: int = Field(
+        default=128,
+        description="Maximum extracted pages kept in the in-memory cache (0 disables caching)",
+    )
+    cache_ttl_seconds: int = Field(
+        default=300, description="Seconds an extracted page stays in the cache"
+    )
 
 
 class PlaywrightSettings(BaseModel):
@@ -62,6 +91,26 @@ class PlaywrightSettings(BaseModel):
         default=50_000,
         description="HTML size threshold in bytes for switching to fast cleaning mode (default: 500KB)",
     )
+    max_structure_items: int = Field(
+        default=200,
+        description="Maximum number of links, images and headings each collected per page",
+    )
+    static_fetch_enabled: bool = Field(
+        default=False,
+        description="Try a plain HTTP fetch first and only render pages that need JavaScript in the browser",
+    )
+    static_fetch_min_text_chars: int = Field(
+        default=500,
+        description="Minimum visible body text for a statically fetched page to be used without rendering",
+    )
+    page_pool_size: int = Field(
+        default=4,
+        description="Maximum number of idle browser pages kept open for reuse (0 disables pooling)",
+    )
+    blocked_resource_types: list[str] = Field(
+        default_factory=lambda: ["image", "font", "stylesheet", "media"],
+        description="Playwright resource types aborted during page loads; only HTML and scripts are needed for extraction",
+    )
 
 
 # Top-level settings class
@@ -87,6 +136,9 @@ class AppSettings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="WEB_EXPLORER_MCP_",
         env_nested_delimiter="_",
+        # Split only once after the section name, so multi-word fields such as
+        # WEB_SEARCH_SEARXNG_URL map to searxng_url instead of searxng -> url
+        env_nested_max_split=1,
         case_sensitive=False,
         extra="ignore",
         env_file=".env",
@@ -1,6 +1,14 @@
 """Dependency injection composition for MCP server."""
 
-from web_explorer_mcp.business.services import WebExplorerService
+from web_explorer_mcp.business.interfaces import (
+    WebpageContentService,
+    WebSearchService,
+)
+from web_explorer_mcp.business.services import (
+    CachedWebpageContentService,
+    CachedWebSearchService,
+    WebExplorerService,
+)
 from web_explorer_mcp.config.settings import AppSettings
 from web_explorer_mcp.integrations.web.playwright_content_service import (
     PlaywrightWebpageContentService,
@@ -20,13 +28,36 @@ def create_web_explorer_service(settings: AppSettings) -> WebExplorerService:
     Returns:
         Configured WebExplorerService instance
     """
-    search_service = SearxngWebSearchService(
+    search_service: WebSearchService = SearxngWebSearchService(
         searxng_url=settings.web_search.searxng_url,
     )
+    if (
+        settings.web_search.cache_max_entries > 0
+        and settings.web_search.cache_ttl_seconds > 0
+    ):
+        search_service = CachedWebSearchService(
+            search_service,
+            max_entries=settings.web_search.cache_max_entries,
+            ttl_seconds=settings.web_search.cache_ttl_seconds,
+        )
 
-    content_service = PlaywrightWebpageContentService(settings.playwright)
+    content_service: WebpageContentService = PlaywrightWebpageContentService(
+        settings.playwright
+    )
+    if (
+        settings.webpage.cache_max_entries > 0
+        and settings.webpage.cache_ttl_seconds > 0
+    ):
+        content_service = CachedWebpageContentService(
+            content_service,
+            max_entries=settings.webpage.cache_max_entries,
+            ttl_seconds=settings.webpage.cache_ttl_seconds,
+        )
 
     return WebExplorerService(
         search_service=search_service,
         content_service=content_service,
+        max_concurrency=settings.webpage.max_concurrency,
+        max_concurrency_per_host=settings.webpage.max_concurrency_per_host,
+        max_search_concurrency=settings.web_search.max_concurrency,
     )
@@ -6,9 +6,11 @@ from typing import Any
 from fastmcp import FastMCP
 from loguru import logger
 
+from web_explorer_mcp.business.services import paginate_content
 from web_explorer_mcp.config.logging_config import logging_config
 from web_explorer_mcp.config.settings import AppSettings
 from web_explorer_mcp.entrypoints.mcp.dependencies import create_web_explorer_service
+from web_explorer_mcp.models.entities import SearchResponse, WebpageContent
 
 mcp = FastMCP("Web Explorer MCP")
 
@@ -20,13 +22,11 @@ async def shutdown_handler(signum, loop):
     """Handle shutdown signals gracefully."""
     logger.info(f"Received signal {signum}, shutting down...")
     try:
-        # Stop the playwright service gracefully
-        playwright_service = getattr(web_explorer_service, "_playwright_service", None)
-        if playwright_service and hasattr(playwright_service, "stop"):
-            await playwright_service.stop()
-        logger.info("Playwright service stopped successfully")
+        # Stop the search and playwright services gracefully
+        await web_explorer_service.stop()
+        logger.info("Services stopped successfully")
     except Exception as e:
-        logger.error(f"Error stopping playwright service: {e}")
+        logger.error(f"Error stopping services: {e}")
 
     # Stop the event loop
     loop.stop()
@@ -113,6 +113,86 @@ async def web_search_tool(
         page_size=page_size,
     )
 
+    return _web_search_response(result)
+
+
+@mcp.tool()
+async def web_search_batch_tool(
+    queries: list[str], page: int = 1, page_size: int | None = None
+) -> dict[str, Any]:
+    """
+    Perform several web searches using SearxNG in one call.
+
+    The searches run concurrently, bounded by the server settings, so the
+    call takes about as long as the slowest search instead of the sum of all
+    of them. The number of queries per call is capped by the server settings
+    (default 10).
+
+    Parameters
+    ----------
+    queries : list[str]
+        The search query strings, each handled as in web_search_tool, at most
+        the configured batch limit.
+
+    page : int, optional
+        Page number requested for every query, starting from 1. Defaults to 1.
+
+    page_size : int, optional
+        Maximum number of results per query. If not provided, uses the default
+        from application settings.
+
+    Returns
+    -------
+    dict
+        - results: list[dict] - One web_search_tool result per query, in the
+          same order as ``queries``. A failed search has its error set and
+          does not affect the others.
+        - error: str | None - Error message if the call was rejected (too
+          many queries), None otherwise
+
+    Examples
+    --------
+    - web_search_batch_tool(["python asyncio", "httpx connection pooling"])
+    """
+    logger.info(
+        f"Web search batch tool called with {len(queries)} queries, page={page}, page_size={page_size}"
+    )
+
+    max_batch_queries = settings.web_search.max_batch_queries
+    if len(queries) > max_batch_queries:
+        logger.warning(
+            f"Web search batch rejected: {len(queries)} queries exceed the limit of {max_batch_queries}"
+        )
+        return {
+            "results": [],
+            "error": f"Too many queries: {len(queries)} given, at most {max_batch_queries} allowed per call",
+        }
+
+    if page_size is None:
+        page_size = settings.web_search.default_page_size
+
+    results = await web_explorer_service.search_many_web(
+        queries=queries,
+        page=page,
+        page_size=page_size,
+    )
+
+    return {
+        "results": [_web_search_response(result) for result in results],
+        "error": None,
+    }
+
+
+def _web_search_response(result: SearchResponse) -> dict[str, Any]:
+    """
+    Convert a search response into the tool response format.
+
+    Args:
+        result: Search response from the search service
+
+    Returns:
+        Tool response dict as documented in web_search_tool
+    """
     # Convert SearchResponse to dict format for backward compatibility
     if result.error:
         return {
@@ -124,21 +204,9 @@ async def web_search_tool(
             "error": result.error,
         }
     else:
-        return {
-            "query": result.query,
-            "page": result.page,
-            "page_size": result.page_size,
-            "total_results": result.total_results,
-            "results": [
-                {
-                    "title": r.title,
-                    "description": r.description,
-                    "url": r.url,
-                }
-                for r in result.results
-            ],
-            "error": None,
-        }
+        # The model fields match the response keys, so dump it in one call;
+        # a falsy error (e.g. "") is still reported as None
+        return result.model_dump() | {"error": None}
 
 
 @mcp.tool()
@@ -147,6 +215,7 @@ async def webpage_content_tool(
     max_chars: int | None = None,
     page: int = 1,
     raw_content: bool = False,
+    render: bool = True,
 ) -> dict[str, Any]:
     """
     Extract and clean webpage content for a provided URL.
@@ -166,6 +235,10 @@ async def webpage_content_tool(
         for readability, but full content is always extracted.
     raw_content: bool, optional
         If True, return raw HTML content without processing. Defaults to False.
+    render: bool, optional
+        If True (default), render the page in the browser with JavaScript. If
+        False, fetch the HTML over plain HTTP and extract it as served, which
+        is much faster for server-rendered pages.
 
     Returns
     -------
@@ -196,6 +269,7 @@ async def webpage_content_tool(
     - webpage_content_tool("https://example.com", max_chars=1000) - Get concise content
     - webpage_content_tool("https://example.com", page=2) - Get next page of content
     - webpage_content_tool("https://example.com", raw_content=True) - Get raw HTML
+    - webpage_content_tool("https://example.com", render=False) - Skip the browser
 
     Notes
     -----
@@ -204,7 +278,7 @@ async def webpage_content_tool(
     - Uses Playwright for JavaScript rendering and accurate content extraction
     """
     logger.info(
-        f"Webpage content tool called with url='{url}', max_chars={max_chars}, page={page}, raw_content={raw_content}"
+        f"Webpage content tool called with url='{url}', max_chars={max_chars}, page={page}, raw_content={raw_content}, render={render}"
     )
 
     if max_chars is None:
@@ -214,11 +288,105 @@ async def webpage_content_tool(
     result = await web_explorer_service.extract_webpage_content(
         url=url,
         raw_content=raw_content,
+        render=render,
     )
 
-    # Apply pagination for display if requested
-    from web_explorer_mcp.business.services import paginate_content
+    return _webpage_content_response(result, max_chars=max_chars, page=page)
+
 
+@mcp.tool()
+async def webpage_content_batch_tool(
+    urls: list[str],
+    max_chars: int | None = None,
+    page: int = 1,
+    raw_content: bool = False,
+    render: bool = True,
+) -> dict[str, Any]:
+    """
+    Extract and clean webpage content for several URLs in one call.
+
+    The pages are extracted concurrently, bounded globally and per host by
+    the server settings, which saves a round trip per URL compared to calling
+    webpage_content_tool repeatedly. Every result carries the full extracted
+    text of its page in main_content next to the paginated main_text, so the
+    number of URLs per call is capped by the server settings (default 20).
+
+    Parameters
+    ----------
+    urls: list[str]
+        The URLs to fetch and extract, at most the configured batch limit.
+    max_chars: int, optional
+        Maximum characters per page to include in each main text. If not
+        provided, 5000 characters are used.
+    page: int, optional
+        Page number of each main text to return (default 1).
+    raw_content: bool, optional
+        If True, return raw HTML content without processing. Defaults to False.
+    render: bool, optional
+        If True (default), render the pages in the browser with JavaScript.
+        If False, extract the HTML as served over plain HTTP.
+
+    Returns
+    -------
+    dict
+        - results: list[dict] - One webpage_content_tool result per URL, in
+          the same order as ``urls``. A failed URL has its error set and does
+          not affect the others. main_content holds the full, unpaginated
+          text of each page.
+        - error: str | None - Error message if the call was rejected (too
+          many URLs), None otherwise
+
+    Examples
+    --------
+    - webpage_content_batch_tool(["https://example.com", "https://example.org"])
+    """
+    logger.info(
+        f"Webpage content batch tool called with {len(urls)} urls, max_chars={max_chars}, page={page}, raw_content={raw_content}, render={render}"
+    )
+
+    max_batch_urls = settings.webpage.max_batch_urls
+    if len(urls) > max_batch_urls:
+        logger.warning(
+            f"Webpage content batch rejected: {len(urls)} urls exceed the limit of {max_batch_urls}"
+        )
+        return {
+            "results": [],
+            "error": f"Too many URLs: {len(urls)} given, at most {max_batch_urls} allowed per call",
+        }
+
+    if max_chars is None:
+        max_chars = settings.webpage.max_chars
+
+    results = await web_explorer_service.extract_many_webpage_contents(
+        urls=urls,
+        raw_content=raw_content,
+        render=render,
+    )
+
+    return {
+        "results": [
+            _webpage_content_response(result, max_chars=max_chars, page=page)
+            for result in results
+        ],
+        "error": None,
+    }
+
+
+def _webpage_content_response(
+    result: WebpageContent, max_chars: int, page: int
+) -> dict[str, Any]:
+    """
+    Convert extracted webpage content into the tool response format.
+
+    Args:
+        result: Extracted webpage content
+        max_chars: Maximum characters per display page of main_text
+        page: Display page of main_text to return
+
+    Returns:
+        Tool response dict as documented in webpage_content_tool
+    """
+    # Apply pagination for display if requested
     paginated_text = result.main_content
     display_length = len(result.main_content)
     current_page = page
@@ -237,6 +405,10 @@ async def webpage_content_tool(
         total_pages = 0
         has_next = False
 
+    # The heading, link and image models have exactly the response keys, so
+    # they are dumped together in one pydantic call instead of field by field
+    structure = result.model_dump(include={"headings", "links", "images"})
+
     # Convert WebpageContent to dict format
     return {
         "url": result.url,
@@ -246,15 +418,9 @@ async def webpage_content_tool(
         "published_date": result.published_date,
         "main_content": result.main_content,  # Full content
         "main_text": paginated_text,  # Paginated for display
-        "headings": [{"level": h.level, "text": h.text} for h in result.headings],
-        "links": [
-            {"url": link.url, "text": link.text, "type": link.type}
-            for link in result.links
-        ],
-        "images": [
-            {"url": img.url, "alt": img.alt, "title": img.title}
-            for img in result.images
-        ],
+        "headings": structure["headings"],
+        "links": structure["links"],
+        "images": structure["images"],
         "metadata": result.metadata,
         "content_type": result.content_type,
         "pagination": result.pagination,
@@ -291,11 +457,7 @@ def main():
     finally:
         # Ensure cleanup happens
         try:
-            playwright_service = getattr(
-                web_explorer_service, "_playwright_service", None
-            )
-            if playwright_service and hasattr(playwright_service, "stop"):
-                loop.run_until_complete(playwright_service.stop())
+            loop.run_until_complete(web_explorer_service.stop())
         except Exception as e:
             logger.error(f"Error during final cleanup: {e}")
         loop.close()
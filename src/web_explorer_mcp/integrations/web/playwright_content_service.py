@@ -1,28 +1,131 @@
+import asyncio
 import re
 import time
-from typing import TypedDict
+from collections import OrderedDict
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup, Comment
+import httpx
+import soupsieve as sv
+from bs4 import BeautifulSoup
 from loguru import logger
+from lxml import etree
+from lxml import html as lxml_html
 from playwright.async_api import (
     Browser,
     BrowserContext,
     Page,
     Playwright,
+    Route,
     async_playwright,
 )
 
 from web_explorer_mcp.business.interfaces import WebpageContentService
 from web_explorer_mcp.config.settings import PlaywrightSettings
-from web_explorer_mcp.models.entities import WebpageContent
+from web_explorer_mcp.models.entities import (
+    WebpageContent,
+    WebpageHeading,
+    WebpageImage,
+    WebpageLink,
+)
+
+# "Page X of Y" indicator inside pagination containers
+_PAGE_OF_RE = re.compile(r"page\s+(\d+)\s+of\s+(\d+)", re.IGNORECASE)
+
+# Request headers sent by the browser context, mimicking a regular Chrome visit
+_BROWSER_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": "gzip, deflate, br",
+    "DNT": "1",
+    "Connection": "keep-alive",
+    "Upgrade-Insecure-Requests": "1",
+    "Sec-Fetch-Dest": "document",
+    "Sec-Fetch-Mode": "navigate",
+    "Sec-Fetch-Site": "none",
+    "Sec-Fetch-User": "?1",
+    "Cache-Control": "max-age=0",
+}
+
+# Request headers for static fetches; httpx sets Accept-Encoding itself to the
+# codings it can decode (gzip, deflate, and br via the brotli extra)
+_STATIC_FETCH_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# How long a host whose pages needed the browser skips the static fetch attempt
+_BROWSER_HOST_TTL_SECONDS = 3600
+
+# Most hosts remembered as needing the browser; the oldest are dropped first
+_BROWSER_HOSTS_MAX_ENTRIES = 1024
+
+
+class NonHtmlResponseError(ValueError):
+    """Raised when a statically fetched URL does not serve HTML."""
+
+    def __init__(self, content_type: str):
+        self.content_type = content_type or "unknown"
+        super().__init__(
+            f"Unsupported content type for extraction: {self.content_type}"
+        )
 
 
-class HeadingDict(TypedDict):
-    """Type definition for heading dictionary."""
+# Anti-detection script, registered once per browser context
+_STEALTH_INIT_SCRIPT = """
+    // Override the navigator.webdriver flag
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => false,
+    });
+
+    // Override navigator.plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5],
+    });
+
+    // Override navigator.languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en'],
+    });
+
+    // Add chrome object
+    window.chrome = {
+        runtime: {},
+    };
+
+    // Override permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+"""
+
+# Nodes that never contribute content, pruned at the lxml level before the
+# BeautifulSoup tree is built
+_PRUNE_XPATH = etree.XPath("//script|//style|//template|//comment()")
+
+# Nodes whose text is not visible, ignored when measuring static page text
+_STATIC_NON_TEXT_XPATH = etree.XPath(
+    "//script|//style|//template|//noscript|//comment()"
+)
+
+# Discourse posts in a discussion thread (e.g., post_1, post_2)
+_DISCOURSE_POST_CSS = sv.compile('article[id^="post_"]')
 
-    level: int
-    text: str
+# Returns the lowercased title and start of the body text, enough to spot
+# anti-bot interstitials without serializing the whole DOM
+_CHALLENGE_PROBE_JS = """
+    () => (document.title + ' ' +
+        (document.body ? document.body.textContent.slice(0, 2000) : '')
+    ).toLowerCase()
+"""
+
+# Phrases shown by common anti-bot interstitial pages
+_CHALLENGE_MARKERS = ("just a moment", "checking your browser")
+
+# Tags collected by the single-pass structure extraction
+_STRUCTURE_TAGS = ["a", "img", "h1", "h2", "h3", "h4", "h5", "h6"]
 
 
 class PlaywrightWebpageContentService(WebpageContentService):
@@ -41,6 +144,12 @@ class PlaywrightWebpageContentService(WebpageContentService):
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
+        self._idle_pages: list[Page] = []
+        self._blocked_resource_types = frozenset(settings.blocked_resource_types)
+        self._http_client: httpx.AsyncClient | None = None
+        # Host -> monotonic time its pages were last found to need the browser,
+        # oldest first
+        self._browser_hosts: OrderedDict[str, float] = OrderedDict()
 
     async def _ensure_browser(self) -> None:
         """Ensure browser is initialized in remote mode."""
@@ -51,7 +160,8 @@ class PlaywrightWebpageContentService(WebpageContentService):
 
             assert self.settings.connection_url is not None
             logger.info(
-                f"Connecting to remote Playwright server at {self.settings.connection_url}"
+                "Connecting to remote Playwright server at {}",
+                self.settings.connection_url,
             )
             self._browser = await self._playwright.chromium.connect(
                 self.settings.connection_url
@@ -67,27 +177,56 @@ class PlaywrightWebpageContentService(WebpageContentService):
                 user_agent=self.settings.user_agent,
                 locale="en-US",
                 timezone_id="America/New_York",
-                extra_http_headers={
-                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-                    "Accept-Language": "en-US,en;q=0.9",
-                    "Accept-Encoding": "gzip, deflate, br",
-                    "DNT": "1",
-                    "Connection": "keep-alive",
-                    "Upgrade-Insecure-Requests": "1",
-                    "Sec-Fetch-Dest": "document",
-                    "Sec-Fetch-Mode": "navigate",
-                    "Sec-Fetch-Site": "none",
-                    "Sec-Fetch-User": "?1",
-                    "Cache-Control": "max-age=0",
-                },
+                extra_http_headers=_BROWSER_HEADERS,
             )
+            # Applies to every page created in this context
+            await self._context.add_init_script(_STEALTH_INIT_SCRIPT)
+            if self.settings.blocked_resource_types:
+                await self._context.route("**/*", self._route_request)
+
+    async def _route_request(self, route: Route) -> None:
+        """Abort requests for resources that are not needed to extract content."""
+        if route.request.resource_type in self._blocked_resource_types:
+            await route.abort()
+        else:
+            await route.continue_()
 
     async def _get_page(self) -> Page:
-        """Get a new page from the browser context."""
+        """Get an idle page from the pool, or a new page from the browser context."""
         await self._ensure_browser()
         assert self._context is not None  # Ensured by _ensure_browser
+        while self._idle_pages:
+            page = self._idle_pages.pop()
+            if not page.is_closed():
+                return page
         return await self._context.new_page()
 
+    async def _release_page(self, page: Page, reusable: bool = True) -> None:
+        """
+        Return a page to the pool, or close it if it cannot be reused.
+
+        Pooled pages are navigated to about:blank so no DOM or scripts of the
+        previous site are kept alive while they sit idle.
+
+        Args:
+            page: Page obtained from _get_page
+            reusable: False if the page may be in a broken state
+        """
+        if page.is_closed():
+            return
+        if (
+            reusable
+            and self._context is not None
+            and len(self._idle_pages) < self.settings.page_pool_size
+        ):
+            try:
+                await page.goto("about:blank")
+                self._idle_pages.append(page)
+                return
+            except Exception as e:
+                logger.debug("Could not recycle page, closing it: {}", e)
+        await page.close()
+
     # Elements to remove (boilerplate, navigation, etc.)
     REMOVE_SELECTORS = [
         "script",
@@ -124,6 +263,11 @@ class PlaywrightWebpageContentService(WebpageContentService):
         "article[data-post-id]",  # Posts with data attributes
     ]
 
+    # Selector lists pre-joined and compiled once, so each group is matched
+    # in a single tree walk without re-parsing selectors on every call
+    _REMOVE_CSS = sv.compile(", ".join(REMOVE_SELECTORS))
+    _PRESERVE_CSS = sv.compile(", ".join([*PRESERVE_SELECTORS, "article"]))
+
     # Content container selectors (ordered by priority)
     CONTENT_SELECTORS = [
         "article",
@@ -138,15 +282,85 @@ class PlaywrightWebpageContentService(WebpageContentService):
         ".article-content",
         ".page-content",
     ]
+    _CONTENT_CSS = [(selector, sv.compile(selector)) for selector in CONTENT_SELECTORS]
+
+    # Pagination container selectors (ordered by priority)
+    PAGINATION_SELECTORS = [
+        ".pagination",
+        ".paging",
+        ".pager",
+        ".page-navigation",
+        ".page-nav",
+        'nav[aria-label="Pagination"]',
+        'nav[aria-label="Page navigation"]',
+        'nav[aria-label*="pagination"]',
+        'nav[aria-label*="paging"]',
+        '[role="navigation"][aria-label*="pagination"]',
+        "nav.pagination",
+        "div.pagination",
+        "ul.pagination",
+        ".paginator",
+        ".pages",
+    ]
+    _PAGINATION_CSS = [
+        (selector, sv.compile(selector)) for selector in PAGINATION_SELECTORS
+    ]
+
+    def _prune_html(self, html: str) -> str:
+        """
+        Drop scripts, styles, templates and comments using raw lxml.
+
+        These nodes are always discarded, so removing them in lxml's C tree
+        keeps BeautifulSoup from wrapping them in Python objects and shrinks
+        every later pass over the soup.
+
+        Args:
+            html: Raw HTML string
+
+        Returns:
+            Pruned HTML string, or the original HTML if lxml cannot parse it
+        """
+        try:
+            doc = lxml_html.document_fromstring(html)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug("lxml pruning skipped: {}", e)
+            return html
+
+        for element in _PRUNE_XPATH(doc):
+            element.drop_tree()
+
+        return lxml_html.tostring(doc, encoding="unicode")
+
+    def _parse_html(self, html: str) -> BeautifulSoup:
+        """
+        Parse HTML into a BeautifulSoup tree.
+
+        Uses the C-based lxml tree builder, which is several times faster than
+        the pure-Python html.parser on large pages, and falls back to
+        html.parser if lxml fails on the document.
+
+        Args:
+            html: Raw HTML string
+
+        Returns:
+            Parsed BeautifulSoup object
+        """
+        try:
+            return BeautifulSoup(html, "lxml")
+        except Exception as e:
+            logger.warning("lxml parsing failed, falling back to html.parser: {}", e)
+            return BeautifulSoup(html, "html.parser")
 
     def _clean_html(
-        self, soup: BeautifulSoup, remove_boilerplate: bool = True
+        self, soup: BeautifulSoup, html_size: int, remove_boilerplate: bool = True
     ) -> BeautifulSoup:
         """
         Remove unwanted elements from HTML.
 
         Args:
             soup: BeautifulSoup object
+            html_size: Size of the markup the soup was parsed from, used to
+                choose the cleaning strategy without re-serializing the tree
             remove_boilerplate: Whether to remove boilerplate elements
 
         Returns:
@@ -155,9 +369,7 @@ class PlaywrightWebpageContentService(WebpageContentService):
         if not remove_boilerplate:
             return soup
 
-        # Estimate HTML size to choose cleaning strategy
-        html_size = len(str(soup))
-        logger.debug(f"HTML size: {html_size} bytes")
+        logger.debug("HTML size: {} bytes", html_size)
 
         # For large pages, use simplified fast cleaning to avoid performance issues
         use_fast_cleaning = html_size > self.settings.large_page_threshold_bytes
@@ -179,25 +391,21 @@ class PlaywrightWebpageContentService(WebpageContentService):
         Returns:
             Cleaned BeautifulSoup object
         """
-        # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            comment.extract()
-
         # Only remove elements that definitely should go, without complex preserve logic
         # This is O(n) instead of O(n*m) for large pages
-        critical_tags = ["script", "style", "noscript", "iframe"]
-        for tag_name in critical_tags:
-            for element in soup.find_all(tag_name):
-                element.decompose()
+        # (scripts, styles and comments are already pruned before parsing)
+        for element in soup.find_all(["noscript", "iframe"]):
+            element.decompose()
 
         # Remove navigation/header/footer only if NOT inside article tags
         # This preserves forum/discussion structure
-        nav_tags = ["nav", "header", "footer"]
-        for tag_name in nav_tags:
-            for element in soup.find_all(tag_name):
-                # Don't remove if inside article (preserve forum structure)
-                if not element.find_parent("article"):
-                    element.decompose()
+        for element in soup.find_all(["nav", "header", "footer"]):
+            # Skip elements already removed with an enclosing match
+            if element.decomposed:
+                continue
+            # Don't remove if inside article (preserve forum structure)
+            if not element.find_parent("article"):
+                element.decompose()
 
         return soup
 
@@ -211,51 +419,31 @@ class PlaywrightWebpageContentService(WebpageContentService):
         Returns:
             Cleaned BeautifulSoup object
         """
-        # Remove comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-            comment.extract()
-
-        # Pre-build set of preserved elements and their descendants
-        # This is much faster than checking for each element individually
-        preserved_elements = set()
-        for preserve_selector in self.PRESERVE_SELECTORS:
-            for elem in soup.select(preserve_selector):
-                preserved_elements.add(elem)
-                # Add all descendants to preserved set
-                for descendant in elem.descendants:
-                    if hasattr(descendant, "name") and descendant.name:
-                        preserved_elements.add(descendant)
-
-        # Also preserve all article elements
-        for article in soup.find_all("article"):
-            preserved_elements.add(article)
-            for descendant in article.descendants:
-                if hasattr(descendant, "name") and descendant.name:
-                    preserved_elements.add(descendant)
+        # Pre-build set of preserved elements (forum posts, comments, articles)
+        # and their descendants, so membership is a single set lookup.
+        # Elements are keyed by id() because Tag.__hash__ serializes the subtree
+        preserved_ids: set[int] = set()
+        for elem in self._PRESERVE_CSS.select(soup):
+            if id(elem) in preserved_ids:
+                continue  # Nested match, descendants already added
+            preserved_ids.add(id(elem))
+            preserved_ids.update(map(id, elem.find_all(True)))
 
         # Remove unwanted elements, but preserve forum posts/comments
-        for selector in self.REMOVE_SELECTORS:
-            for element in soup.select(selector):
-                # Quick check if element is in preserved set or has preserved parent
-                if element in preserved_elements:
-                    continue
-
-                # Check if any parent is preserved
-                should_preserve = False
-                parent = element.parent
-                while parent and parent.name:
-                    if parent in preserved_elements:
-                        should_preserve = True
-                        break
-                    parent = parent.parent
-
-                if not should_preserve:
-                    element.decompose()
+        for element in self._REMOVE_CSS.select(soup):
+            # Skip elements already removed with an enclosing match
+            if element.decomposed or id(element) in preserved_ids:
+                continue
+            element.decompose()
 
-        # Remove empty elements (only for thorough cleaning)
+        # Remove empty elements (only for thorough cleaning). Both checks stop
+        # at the first text or media descendant instead of collecting them all
         for tag in soup.find_all():
-            if not tag.get_text(strip=True) and not tag.find_all(
-                ["img", "video", "audio"]
+            if tag.decomposed:
+                continue
+            if (
+                next(tag.stripped_strings, None) is None
+                and tag.find(["img", "video", "audio"]) is None
             ):
                 tag.decompose()
 
@@ -276,26 +464,34 @@ class PlaywrightWebpageContentService(WebpageContentService):
         """
         # Special handling for forum/discussion pages (e.g., Discourse)
         # Check for multiple posts in a thread using Discourse-specific selectors
-        posts = soup.select('article[id^="post_"]')
+        posts = _DISCOURSE_POST_CSS.select(soup)
         if len(posts) > 1:
-            # Find common parent that contains all posts
-            common_parent = posts[0].parent
-            while common_parent and not all(
-                post in common_parent.descendants for post in posts
-            ):
-                common_parent = common_parent.parent
+            # Find common parent that contains all posts: the nearest ancestor
+            # of the first post that is also an ancestor of every other post
+            shared_ancestor_ids = set.intersection(
+                *({id(parent) for parent in post.parents} for post in posts[1:])
+            )
+            common_parent = next(
+                (
+                    parent
+                    for parent in posts[0].parents
+                    if id(parent) in shared_ancestor_ids
+                ),
+                None,
+            )
 
             if common_parent:
                 logger.debug(
-                    f"Found discussion thread with {len(posts)} posts, using common parent"
+                    "Found discussion thread with {} posts, using common parent",
+                    len(posts),
                 )
                 return common_parent
 
         # Try known content selectors
-        for selector in self.CONTENT_SELECTORS:
-            content = soup.select_one(selector)
+        for selector, compiled in self._CONTENT_CSS:
+            content = compiled.select_one(soup)
             if content:
-                logger.debug(f"Found main content using selector: {selector}")
+                logger.debug("Found main content using selector: {}", selector)
                 return content
 
         # Fallback: find largest text block
@@ -306,14 +502,38 @@ class PlaywrightWebpageContentService(WebpageContentService):
                 candidates.append((text_length, tag))
 
         if candidates:
-            candidates.sort(reverse=True)
-            logger.debug(f"Found main content by text length: {candidates[0][0]} chars")
-            return candidates[0][1]
+            # Compare lengths only; equal lengths keep the outermost block
+            text_length, tag = max(candidates, key=lambda candidate: candidate[0])
+            logger.debug("Found main content by text length: {} chars", text_length)
+            return tag
 
         # Last resort: return body
         logger.debug("Using body as main content")
         return soup.body if soup.body else soup
 
+    async def _is_challenge_page(self, page: Page) -> bool:
+        """
+        Check whether the page is showing an anti-bot challenge.
+
+        Only the title and a short prefix of the body text are transferred
+        from the browser, instead of the full serialized HTML.
+
+        Args:
+            page: Playwright page instance
+
+        Returns:
+            True if a challenge marker was found
+        """
+        try:
+            probe = await page.evaluate(_CHALLENGE_PROBE_JS)
+        except Exception as e:
+            logger.debug("Challenge probe failed: {}", e)
+            return False
+
+        return isinstance(probe, str) and any(
+            marker in probe for marker in _CHALLENGE_MARKERS
+        )
+
     async def _extract_js_metadata(self, page: Page) -> dict:
         """
         Extract metadata from JavaScript (OpenGraph, JSON-LD, etc.).
@@ -356,7 +576,7 @@ class PlaywrightWebpageContentService(WebpageContentService):
             """)
             return js_data
         except Exception as e:
-            logger.debug(f"Failed to extract JS metadata: {e}")
+            logger.debug("Failed to extract JS metadata: {}", e)
             return {"meta": {}, "jsonLd": []}
 
     def _extract_pagination_info(self, soup: BeautifulSoup, base_url: str) -> dict:
@@ -379,30 +599,12 @@ class PlaywrightWebpageContentService(WebpageContentService):
             "all_pages": [],
         }
 
-        # Common pagination selectors
-        pagination_selectors = [
-            ".pagination",
-            ".paging",
-            ".pager",
-            ".page-navigation",
-            ".page-nav",
-            'nav[aria-label="Pagination"]',
-            'nav[aria-label="Page navigation"]',
-            'nav[aria-label*="pagination"]',
-            'nav[aria-label*="paging"]',
-            '[role="navigation"][aria-label*="pagination"]',
-            "nav.pagination",
-            "div.pagination",
-            "ul.pagination",
-            ".paginator",
-            ".pages",
-        ]
-
+        # Find the first matching pagination container
         pagination_container = None
-        for selector in pagination_selectors:
-            pagination_container = soup.select_one(selector)
+        for selector, compiled in self._PAGINATION_CSS:
+            pagination_container = compiled.select_one(soup)
             if pagination_container:
-                logger.debug(f"Found pagination using selector: {selector}")
+                logger.debug("Found pagination using selector: {}", selector)
                 break
 
         if not pagination_container:
@@ -424,7 +626,7 @@ class PlaywrightWebpageContentService(WebpageContentService):
                 href = link.get("href")
                 if isinstance(href, str):
                     pagination["next_page"] = urljoin(base_url, href)
-                    logger.debug(f"Found next page: {pagination['next_page']}")
+                    logger.debug("Found next page: {}", pagination["next_page"])
                 break
 
         # Extract previous page link
@@ -441,7 +643,7 @@ class PlaywrightWebpageContentService(WebpageContentService):
                 href = link.get("href")
                 if isinstance(href, str):
                     pagination["prev_page"] = urljoin(base_url, href)
-                    logger.debug(f"Found prev page: {pagination['prev_page']}")
+                    logger.debug("Found prev page: {}", pagination["prev_page"])
                 break
 
         # Extract current page and all page links
@@ -480,8 +682,7 @@ class PlaywrightWebpageContentService(WebpageContentService):
             pagination["total_pages"] = max(p["page"] for p in pagination["all_pages"])
 
         # Look for "Page X of Y" pattern
-        page_info_text = pagination_container.get_text()
-        page_pattern = re.search(r"page\s+(\d+)\s+of\s+(\d+)", page_info_text.lower())
+        page_pattern = _PAGE_OF_RE.search(pagination_container.get_text())
         if page_pattern:
             pagination["current_page"] = int(page_pattern.group(1))
             pagination["total_pages"] = int(page_pattern.group(2))
@@ -540,14 +741,19 @@ class PlaywrightWebpageContentService(WebpageContentService):
         # Get text with proper spacing - use space separator to avoid breaking words
         text = content.get_text(separator=" ", strip=True)
 
-        # Normalize whitespace: collapse multiple spaces, remove excessive newlines
+        # Normalize whitespace: collapse multiple spaces, remove excessive newlines.
+        # Without newlines there is no paragraph structure to keep, so a single
+        # C-level split/join folds everything in one pass
+        if "\n" not in text:
+            return " ".join(text.split())
+
         # Split by newlines first to preserve paragraph structure
         lines = []
         for line in text.split("\n"):
-            # Normalize spaces within each line
-            line = " ".join(line.split())
-            if line:  # Skip empty lines
-                lines.append(line)
+            # Normalize spaces within each line, skipping empty lines
+            words = line.split()
+            if words:
+                lines.append(" ".join(words))
 
         # Join with double newlines for readability
         return "\n\n".join(lines)
@@ -588,53 +794,6 @@ class PlaywrightWebpageContentService(WebpageContentService):
 
         return "webpage"
 
-    async def _close_browser(self) -> None:
-        """Close browser context (keep browser connection alive for reuse)."""
-        # Only close context if it exists, keep browser connection alive
-        if self._context:
-            await self._context.close()
-            self._context = None
-
-    def _extract_links(self, content, base_url: str) -> list[dict[str, str]]:
-        """
-        Extract links from content.
-
-        Args:
-            content: BeautifulSoup element with content
-            base_url: Base URL for resolving relative links
-
-        Returns:
-            List of link dictionaries
-        """
-        links = []
-        seen_urls = set()
-
-        for link in content.find_all("a", href=True):
-            href_value = link.get("href")
-            if not isinstance(href_value, str):
-                continue
-
-            href = str(href_value)
-            text = link.get_text(strip=True)
-
-            # Skip anchors and javascript
-            if href.startswith("#") or href.startswith("javascript:"):
-                continue
-
-            # Resolve relative URLs
-            full_url = urljoin(base_url, href)
-
-            # Avoid duplicates
-            if full_url in seen_urls:
-                continue
-            seen_urls.add(full_url)
-
-            links.append(
-                {"url": full_url, "text": text, "type": self._classify_link(full_url)}
-            )
-
-        return links
-
     def _classify_link(self, url: str) -> str:
         """
         Classify link type based on URL.
@@ -663,62 +822,501 @@ class PlaywrightWebpageContentService(WebpageContentService):
         else:
             return "internal"
 
-    def _extract_images(self, content, base_url: str) -> list[dict[str, str]]:
+    def _extract_structure(
+        self, content, base_url: str
+    ) -> tuple[list[WebpageLink], list[WebpageImage], list[WebpageHeading]]:
         """
-        Extract images from content.
+        Extract links, images and headings from content in a single traversal.
 
         Args:
             content: BeautifulSoup element with content
             base_url: Base URL for resolving relative URLs
 
+        Each list is capped at ``settings.max_structure_items``; the walk
+        stops early once all three lists are full.
+
         Returns:
-            List of image dictionaries
+            Tuple of (links, images, headings):
+            - links: List of links (deduplicated by URL)
+            - images: List of images (deduplicated by URL)
+            - headings: List of headings with level and text
         """
-        images = []
-        seen_urls = set()
+        links: list[WebpageLink] = []
+        images: list[WebpageImage] = []
+        headings: list[WebpageHeading] = []
+        seen_link_urls: set[str] = set()
+        seen_image_urls: set[str] = set()
+        limit = self.settings.max_structure_items
+
+        for element in content.find_all(_STRUCTURE_TAGS):
+            if len(links) >= limit and len(images) >= limit and len(headings) >= limit:
+                break
 
-        for img in content.find_all("img"):
-            src = img.get("src") or img.get("data-src")
-            if not src:
-                continue
+            name = element.name
 
-            # Resolve relative URLs
-            full_url = urljoin(base_url, str(src))
+            if name == "a":
+                if len(links) >= limit:
+                    continue
 
-            # Avoid duplicates
-            if full_url in seen_urls:
-                continue
-            seen_urls.add(full_url)
+                href = element.get("href")
+                # Skip missing hrefs, anchors and javascript
+                if not isinstance(href, str) or href.startswith(("#", "javascript:")):
+                    continue
 
-            images.append(
-                {
-                    "url": full_url,
-                    "alt": img.get("alt", ""),
-                    "title": img.get("title", ""),
-                }
+                # Resolve relative URLs and avoid duplicates
+                full_url = urljoin(base_url, href)
+                if full_url in seen_link_urls:
+                    continue
+                seen_link_urls.add(full_url)
+
+                links.append(
+                    WebpageLink(
+                        url=full_url,
+                        text=element.get_text(strip=True),
+                        type=self._classify_link(full_url),
+                    )
+                )
+
+            elif name == "img":
+                if len(images) >= limit:
+                    continue
+
+                src = element.get("src") or element.get("data-src")
+                if not src:
+                    continue
+
+                # Resolve relative URLs and avoid duplicates
+                full_url = urljoin(base_url, str(src))
+                if full_url in seen_image_urls:
+                    continue
+                seen_image_urls.add(full_url)
+
+                images.append(
+                    WebpageImage(
+                        url=full_url,
+                        alt=element.get("alt", ""),
+                        title=element.get("title", ""),
+                    )
+                )
+
+            elif len(headings) < limit:
+                text = element.get_text(strip=True)
+                if text:
+                    headings.append(WebpageHeading(level=int(name[1]), text=text))
+
+        return links, images, headings
+
+    def _extract_metadata(
+        self, soup: BeautifulSoup, js_metadata: dict, result: WebpageContent
+    ) -> None:
+        """
+        Fill title, description, author and date, with fallbacks to JS data.
+
+        Must run before cleaning, which drops the empty <meta> elements.
+
+        Args:
+            soup: Parsed page, before any cleaning
+            js_metadata: Metadata collected from the page via JavaScript
+            result: Result object to populate
+        """
+        title = ""
+        if soup.title and soup.title.string:
+            title = soup.title.string.strip()
+        elif js_metadata.get("meta", {}).get("og:title"):
+            title = js_metadata["meta"]["og:title"]
+        else:
+            og_title = soup.find("meta", property="og:title")
+            if og_title:
+                content = og_title.get("content")
+                if isinstance(content, str):
+                    title = content.strip()
+            else:
+                h1 = soup.find("h1")
+                if h1:
+                    title = h1.get_text(strip=True)
+        result.title = title
+
+        description = ""
+        if js_metadata.get("meta", {}).get("og:description"):
+            description = js_metadata["meta"]["og:description"]
+        else:
+            meta_desc = soup.find("meta", attrs={"name": "description"})
+            if meta_desc:
+                content = meta_desc.get("content")
+                if isinstance(content, str):
+                    description = content.strip()
+            else:
+                og_desc = soup.find("meta", property="og:description")
+                if og_desc:
+                    content = og_desc.get("content")
+                    if isinstance(content, str):
+                        description = content.strip()
+        result.description = description
+
+        # Extract author
+        author = ""
+        if js_metadata.get("meta", {}).get("article:author"):
+            author = js_metadata["meta"]["article:author"]
+        else:
+            author_meta = soup.find("meta", attrs={"name": "author"})
+            if author_meta:
+                content = author_meta.get("content")
+                if isinstance(content, str):
+                    author = content.strip()
+        result.author = author
+
+        # Extract published date
+        published_date = ""
+        if js_metadata.get("meta", {}).get("article:published_time"):
+            published_date = js_metadata["meta"]["article:published_time"]
+        else:
+            date_meta = soup.find("meta", property="article:published_time")
+            if date_meta:
+                content = date_meta.get("content")
+                if isinstance(content, str):
+                    published_date = content.strip()
+        result.published_date = published_date
+
+        # Store metadata
+        result.metadata = js_metadata.get("meta", {})
+
+    def _process_html(
+        self, html: str, url: str, js_metadata: dict, result: WebpageContent
+    ) -> None:
+        """
+        Parse rendered HTML and fill the extracted fields of the result.
+
+        This is the CPU-bound part of extraction. It runs in a worker thread
+        so other extractions keep making progress on the event loop.
+
+        Args:
+            html: Rendered page HTML
+            url: Page URL for resolving relative links
+            js_metadata: Metadata collected from the page via JavaScript
+            result: Result object to populate
+        """
+        # Prune non-content nodes with lxml, then parse with BeautifulSoup
+        logger.debug("Parsing HTML with BeautifulSoup...")
+        html = self._prune_html(html)
+        soup = self._parse_html(html)
+        logger.debug("BeautifulSoup parsing completed")
+
+        # Detect content type
+        logger.debug("Detecting content type...")
+        content_type = self._detect_content_type(url, soup)
+        logger.debug("Detected content type: {}", content_type)
+        result.content_type = content_type
+
+        # Extract metadata BEFORE cleaning (needs <meta> and <h1> elements)
+        logger.debug("Extracting metadata...")
+        self._extract_metadata(soup, js_metadata, result)
+
+        # Extract pagination info BEFORE cleaning (needs navigation elements)
+        logger.debug("Extracting pagination info...")
+        pagination_info = self._extract_pagination_info(soup, url)
+        logger.debug(
+            "Pagination info extracted: {}", pagination_info.get("has_pagination")
+        )
+        if pagination_info.get("has_pagination"):
+            logger.info(
+                "Detected pagination: current={}, total={}, next={}, prev={}",
+                pagination_info.get("current_page"),
+                pagination_info.get("total_pages"),
+                bool(pagination_info.get("next_page")),
+                bool(pagination_info.get("prev_page")),
             )
+        result.pagination = pagination_info
+
+        # Clean HTML and find main content
+        logger.debug("Cleaning HTML...")
+        cleaned_soup = self._clean_html(soup, len(html), remove_boilerplate=True)
+        logger.debug("HTML cleaned")
+
+        logger.debug("Finding main content...")
+        main_content = self._find_main_content(cleaned_soup)
+        logger.debug("Main content found")
+
+        # Extract structured data BEFORE modifying DOM
+        logger.debug("Extracting links, images and headings...")
+        result.links, result.images, result.headings = self._extract_structure(
+            main_content, url
+        )
+        logger.debug(
+            "Extracted {} links, {} images, {} headings",
+            len(result.links),
+            len(result.images),
+            len(result.headings),
+        )
+
+        # Extract text content with inline links and images. This rewrites the
+        # tree in place, which is safe because everything else has been read
+        logger.debug("Extracting text content...")
+        markdown_content = self._extract_text_content(main_content, url)
+        logger.debug("Text content extracted: {} characters", len(markdown_content))
 
-        return images
+        # Set content
+        logger.debug("Setting final content...")
+        result.main_content = markdown_content or ""
+        result.length = len(result.main_content)
+        logger.debug("Content extraction completed")
 
-    def _extract_headings(self, content) -> list[HeadingDict]:
+    async def _render_page(self, page: Page, url: str, timeout: float) -> str:
         """
-        Extract headings structure.
+        Navigate to the URL in the browser and return the rendered HTML.
 
         Args:
-            content: BeautifulSoup element with content
+            page: Playwright page instance
+            url: URL to navigate to
+            timeout: Navigation timeout in seconds
 
         Returns:
-            List of heading dictionaries with 'level' (int) and 'text' (str)
+            Rendered page HTML
         """
-        headings: list[HeadingDict] = []
+        # Navigate with anti-bot detection handling
+        # Use shorter timeout and don't wait for everything to load
+        logger.debug(
+            "Starting page.goto() with timeout={}s, wait_until='domcontentloaded'",
+            timeout,
+        )
+        try:
+            await page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=timeout * 1000,
+            )
+            logger.debug("page.goto() completed successfully")
+        except Exception as e:
+            # If navigation times out, log but continue - page might be partially loaded
+            logger.warning("Navigation timeout or error (continuing anyway): {}", e)
 
-        for heading in content.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]):
-            text = heading.get_text(strip=True)
-            if text:
-                level: int = int(heading.name[1])
-                headings.append({"level": level, "text": text})
+        # Quick check for anti-bot challenges (reduced from 3s to 1s)
+        await page.wait_for_timeout(1000)
+
+        # Check if we hit a challenge
+        if await self._is_challenge_page(page):
+            logger.info("Detected anti-bot challenge, waiting for completion...")
+            await page.wait_for_timeout(3000)  # Only wait extra if challenge detected
+
+        # Wait for full load with shorter timeout - but don't fail if it times out
+        try:
+            await page.wait_for_load_state(
+                self.settings.wait_for_load_state,
+                timeout=5000,  # Further reduced from 10s to 5s
+            )
+        except Exception as e:
+            logger.debug("Load state timeout (continuing anyway): {}", e)
+            # Continue anyway - page might still be usable
+
+        # Simulate human-like interaction (optional, only if not timed out)
+        try:
+            await page.mouse.move(100, 100)
+            await page.wait_for_timeout(200)  # Reduced from 300ms to 200ms
+        except Exception as e:
+            logger.debug("Mouse simulation failed (continuing anyway): {}", e)
 
-        return headings
+        # Additional wait for dynamic content (reduced from 2s to 0.5s)
+        await page.wait_for_timeout(500)
+
+        logger.debug("Getting page HTML content...")
+        html = await page.content()
+        logger.debug("Got HTML content: {} characters", len(html))
+        return html
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client for static fetches, creating it on first use.
+
+        Uses the same keep-alive pool limits as the SearxNG search client, so
+        connections to a host are reused between fetches.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                headers={
+                    "User-Agent": self.settings.user_agent,
+                    **_STATIC_FETCH_HEADERS,
+                },
+            )
+        return self._http_client
+
+    @staticmethod
+    def _static_metadata(doc) -> dict:
+        """
+        Read meta tags from a parsed static document.
+
+        Args:
+            doc: lxml document of the served HTML
+
+        Returns:
+            Metadata in the same shape as _extract_js_metadata
+        """
+        meta = {}
+        for element in doc.iter("meta"):
+            key = element.get("property") or element.get("name")
+            content = element.get("content")
+            if key and content:
+                meta[key] = content
+        return {"meta": meta, "jsonLd": []}
+
+    def _read_static_metadata(self, html: str) -> dict:
+        """
+        Read metadata from statically served HTML without judging the page.
+
+        Args:
+            html: HTML as served by the web server
+
+        Returns:
+            Metadata in the same shape as _extract_js_metadata, empty if the
+            HTML cannot be parsed
+        """
+        try:
+            doc = lxml_html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            return {"meta": {}, "jsonLd": []}
+        return self._static_metadata(doc)
+
+    def _inspect_static_html(self, html: str) -> dict | None:
+        """
+        Decide whether statically served HTML can be used without rendering.
+
+        A page needs JavaScript when it shows an anti-bot challenge or its
+        body carries less visible text than ``static_fetch_min_text_chars``
+        (SPA shells, "enable JavaScript" stubs).
+
+        Args:
+            html: HTML as served by the web server
+
+        Returns:
+            Metadata in the same shape as _extract_js_metadata if the page is
+            usable as is, or None if it has to be rendered in the browser
+        """
+        try:
+            doc = lxml_html.document_fromstring(html)
+        except (etree.ParserError, ValueError):
+            return None
+
+        title = (doc.findtext(".//title") or "").lower()
+        if any(marker in title for marker in _CHALLENGE_MARKERS):
+            return None
+
+        metadata = self._static_metadata(doc)
+
+        body = doc.find("body")
+        if body is None:
+            return None
+        for element in _STATIC_NON_TEXT_XPATH(body):
+            element.drop_tree()
+        text_length = len("".join(body.text_content().split()))
+        if text_length < self.settings.static_fetch_min_text_chars:
+            return None
+
+        return metadata
+
+    def _host_needs_browser(self, host: str) -> bool:
+        """Check whether a host's pages recently needed the browser."""
+        seen_at = self._browser_hosts.get(host)
+        if seen_at is None:
+            return False
+        if time.monotonic() - seen_at > _BROWSER_HOST_TTL_SECONDS:
+            del self._browser_hosts[host]
+            return False
+        return True
+
+    def _remember_browser_host(self, host: str) -> None:
+        """
+        Record that a host's pages need the browser.
+
+        Expired entries are dropped on every insert and the mapping is capped
+        at _BROWSER_HOSTS_MAX_ENTRIES, so a long-running server visiting many
+        hosts does not grow it without bound.
+        """
+        now = time.monotonic()
+        self._browser_hosts[host] = now
+        self._browser_hosts.move_to_end(host)
+        while self._browser_hosts and (
+            len(self._browser_hosts) > _BROWSER_HOSTS_MAX_ENTRIES
+            or now - next(iter(self._browser_hosts.values()))
+            > _BROWSER_HOST_TTL_SECONDS
+        ):
+            self._browser_hosts.popitem(last=False)
+
+    async def _request_static_html(self, url: str, timeout: int) -> str:
+        """
+        Fetch a URL over plain HTTP and return the HTML it serves.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            HTML as served by the web server
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+            NonHtmlResponseError: If the response is not HTML
+        """
+        response = await self._get_http_client().get(url, timeout=timeout)
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type:
+            raise NonHtmlResponseError(content_type)
+        return response.text
+
+    async def _fetch_static(
+        self, url: str, timeout: int, force: bool = False
+    ) -> tuple[str, dict] | None:
+        """
+        Fetch the page over plain HTTP, skipping the browser when possible.
+
+        Hosts whose HTML turns out to need JavaScript (or shows an anti-bot
+        challenge) are remembered for _BROWSER_HOST_TTL_SECONDS, so further
+        pages from them go straight to rendering without a wasted HTTP round
+        trip. Error statuses and non-HTML responses only send that URL to the
+        browser, since they say nothing about the host's other pages.
+
+        Args:
+            url: URL to fetch
+            timeout: Request timeout in seconds
+            force: Use the served HTML even if the page seems to need
+                JavaScript; HTTP errors and non-HTML responses are raised
+                instead of returning None
+
+        Returns:
+            Tuple of (html, metadata) for pages that do not need JavaScript,
+            or None if the page has to be rendered in the browser
+
+        Raises:
+            httpx.HTTPError: If force is set and the request fails
+            NonHtmlResponseError: If force is set and the response is not HTML
+        """
+        if force:
+            html = await self._request_static_html(url, timeout)
+            return html, await asyncio.to_thread(self._read_static_metadata, html)
+
+        host = urlparse(url).netloc
+        if self._host_needs_browser(host):
+            logger.debug("Host {} needs the browser, skipping static fetch", host)
+            return None
+
+        try:
+            html = await self._request_static_html(url, timeout)
+        except (httpx.HTTPError, NonHtmlResponseError) as e:
+            logger.debug("Static fetch failed, using browser: {}", e)
+            return None
+
+        metadata = await asyncio.to_thread(self._inspect_static_html, html)
+        if metadata is None:
+            logger.debug("Page needs JavaScript rendering, using browser")
+            self._remember_browser_host(host)
+            return None
+
+        logger.debug("Using statically served HTML: {} characters", len(html))
+        return html, metadata
 
     async def extract_content(
         self,
@@ -726,6 +1324,7 @@ class PlaywrightWebpageContentService(WebpageContentService):
         raw_content: bool = False,
         timeout: int = 30,
         favor_precision: bool = True,
+        render: bool = True,
     ) -> WebpageContent:
         """
         Extract full content from webpage using Playwright for JavaScript rendering.
@@ -736,18 +1335,15 @@ class PlaywrightWebpageContentService(WebpageContentService):
         Args:
             url: URL to extract content from
             raw_content: Return raw HTML if True
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds; a failed static fetch attempt
+                and the browser render that follows share this budget
             favor_precision: Favor precision over recall in content extraction
+            render: Render the page in the browser if True; if False, fetch it
+                over plain HTTP and extract the served HTML without JavaScript
 
         Returns:
             WebpageContent with full extracted data or error
         """
-        from web_explorer_mcp.models.entities import (
-            WebpageHeading,
-            WebpageImage,
-            WebpageLink,
-        )
-
         result = WebpageContent(
             url=url,
             title="",
@@ -770,281 +1366,120 @@ class PlaywrightWebpageContentService(WebpageContentService):
             return result
 
         logger.info(
-            f"Starting Playwright webpage content extraction: url='{url}', raw_content={raw_content}, timeout={timeout}s"
+            "Starting Playwright webpage content extraction: url='{}', raw_content={}, timeout={}s, render={}",
+            url,
+            raw_content,
+            timeout,
+            render,
         )
 
         page_instance = None
+        page_reusable = True
         start_time = time.time()
         try:
-            page_instance = await self._get_page()
-
-            # Add anti-detection script before navigation
-            await page_instance.add_init_script("""
-                // Override the navigator.webdriver flag
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => false,
-                });
-                
-                // Override navigator.plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5],
-                });
-                
-                // Override navigator.languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en'],
-                });
-                
-                // Add chrome object
-                window.chrome = {
-                    runtime: {},
-                };
-                
-                // Override permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-            """)
-
-            # Navigate with anti-bot detection handling
-            # Use shorter timeout and don't wait for everything to load
-            logger.debug(
-                f"Starting page.goto() with timeout={timeout}s, wait_until='domcontentloaded'"
-            )
-            try:
-                await page_instance.goto(
-                    url,
-                    wait_until="domcontentloaded",
-                    timeout=timeout * 1000,
-                )
-                logger.debug("page.goto() completed successfully")
-            except Exception as e:
-                # If navigation times out, log but continue - page might be partially loaded
-                logger.warning(f"Navigation timeout or error (continuing anyway): {e}")
-
-            # Quick check for anti-bot challenges (reduced from 3s to 1s)
-            await page_instance.wait_for_timeout(1000)
-
-            # Check if we hit a challenge
-            page_content = await page_instance.content()
-            if (
-                "just a moment" in page_content.lower()
-                or "checking your browser" in page_content.lower()
-            ):
-                logger.info("Detected anti-bot challenge, waiting for completion...")
-                await page_instance.wait_for_timeout(
-                    3000
-                )  # Only wait extra if challenge detected
-
-            # Wait for full load with shorter timeout - but don't fail if it times out
-            try:
-                await page_instance.wait_for_load_state(
-                    self.settings.wait_for_load_state,
-                    timeout=5000,  # Further reduced from 10s to 5s
-                )
-            except Exception as e:
-                logger.debug(f"Load state timeout (continuing anyway): {e}")
-                # Continue anyway - page might still be usable
-
-            # Simulate human-like interaction (optional, only if not timed out)
-            try:
-                await page_instance.mouse.move(100, 100)
-                await page_instance.wait_for_timeout(200)  # Reduced from 300ms to 200ms
-            except Exception as e:
-                logger.debug(f"Mouse simulation failed (continuing anyway): {e}")
-
-            # Additional wait for dynamic content (reduced from 2s to 0.5s)
-            await page_instance.wait_for_timeout(500)
+            static_page = None
+            render_timeout: float = timeout
+            if not render:
+                static_page = await self._fetch_static(url, timeout, force=True)
+            elif self.settings.static_fetch_enabled:
+                static_started = time.monotonic()
+                static_page = await self._fetch_static(url, timeout)
+                # The browser only gets what the static attempt left over
+                render_timeout = timeout - (time.monotonic() - static_started)
+
+            if static_page is not None:
+                html, js_metadata = static_page
+            else:
+                if render_timeout <= 0:
+                    raise TimeoutError(
+                        f"Static fetch used the whole {timeout}s timeout"
+                    )
+                page_instance = await self._get_page()
+                html = await self._render_page(page_instance, url, render_timeout)
 
-            logger.debug("Getting page HTML content...")
-            html = await page_instance.content()
-            logger.debug(f"Got HTML content: {len(html)} characters")
+                js_metadata = {}
+                if not raw_content:
+                    logger.debug("Extracting JS metadata...")
+                    js_metadata = await self._extract_js_metadata(page_instance)
+                    logger.debug("JS metadata extracted: {} items", len(js_metadata))
 
             if raw_content:
                 result.main_content = html
                 result.length = len(html)
             else:
-                # Extract JS metadata first
-                logger.debug("Extracting JS metadata...")
-                js_metadata = await self._extract_js_metadata(page_instance)
-                logger.debug(f"JS metadata extracted: {len(js_metadata)} items")
-
-                # Parse HTML with BeautifulSoup
-                logger.debug("Parsing HTML with BeautifulSoup...")
-                soup = BeautifulSoup(html, "html.parser")
-                logger.debug("BeautifulSoup parsing completed")
-
-                # Detect content type
-                logger.debug("Detecting content type...")
-                content_type = self._detect_content_type(url, soup)
-                logger.debug(f"Detected content type: {content_type}")
-                result.content_type = content_type
-
-                # Extract pagination info BEFORE cleaning (needs navigation elements)
-                logger.debug("Extracting pagination info...")
-                pagination_info = self._extract_pagination_info(soup, url)
-                logger.debug(
-                    f"Pagination info extracted: {pagination_info.get('has_pagination')}"
-                )
-                if pagination_info.get("has_pagination"):
-                    logger.info(
-                        f"Detected pagination: current={pagination_info.get('current_page')}, "
-                        f"total={pagination_info.get('total_pages')}, "
-                        f"next={bool(pagination_info.get('next_page'))}, "
-                        f"prev={bool(pagination_info.get('prev_page'))}"
-                    )
-                result.pagination = pagination_info
-
-                # Clean HTML and find main content
-                logger.debug("Cleaning HTML...")
-                cleaned_soup = self._clean_html(soup, remove_boilerplate=True)
-                logger.debug("HTML cleaned")
-
-                logger.debug("Finding main content...")
-                main_content = self._find_main_content(cleaned_soup)
-                logger.debug("Main content found")
-
-                # Extract structured data BEFORE modifying DOM
-                logger.debug("Extracting links...")
-                links_data = self._extract_links(main_content, url)
-                logger.debug(f"Extracted {len(links_data)} links")
-
-                logger.debug("Extracting images...")
-                images_data = self._extract_images(main_content, url)
-                logger.debug(f"Extracted {len(images_data)} images")
-
-                logger.debug("Extracting headings...")
-                headings_data = self._extract_headings(main_content)
-                logger.debug(f"Extracted {len(headings_data)} headings")
-
-                # Convert to Pydantic models
-                from web_explorer_mcp.models.entities import (
-                    WebpageHeading,
-                    WebpageImage,
-                    WebpageLink,
-                )
-
-                logger.debug("Converting to Pydantic models...")
-                result.links = [WebpageLink(**link) for link in links_data]
-                result.images = [WebpageImage(**img) for img in images_data]
-                result.headings = [WebpageHeading(**h) for h in headings_data]
-                logger.debug("Pydantic models created")
-
-                # Extract text content with inline links and images
-                # Make a copy to avoid modifying the original
-                import copy
-
-                logger.debug("Extracting text content...")
-                main_content_copy = copy.copy(main_content)
-                markdown_content = self._extract_text_content(main_content_copy, url)
-                logger.debug(
-                    f"Text content extracted: {len(markdown_content)} characters"
+                # Parse and extract off the event loop - this is CPU-bound
+                await asyncio.to_thread(
+                    self._process_html, html, url, js_metadata, result
                 )
 
-                # Extract metadata with fallbacks to JS data
-                logger.debug("Extracting metadata...")
-                title = ""
-                if soup.title and soup.title.string:
-                    title = soup.title.string.strip()
-                elif js_metadata.get("meta", {}).get("og:title"):
-                    title = js_metadata["meta"]["og:title"]
-                else:
-                    og_title = soup.find("meta", property="og:title")
-                    if og_title:
-                        content = og_title.get("content")
-                        if isinstance(content, str):
-                            title = content.strip()
-                    else:
-                        h1 = soup.find("h1")
-                        if h1:
-                            title = h1.get_text(strip=True)
-                result.title = title
-
-                description = ""
-                if js_metadata.get("meta", {}).get("og:description"):
-                    description = js_metadata["meta"]["og:description"]
-                else:
-                    meta_desc = soup.find("meta", attrs={"name": "description"})
-                    if meta_desc:
-                        content = meta_desc.get("content")
-                        if isinstance(content, str):
-                            description = content.strip()
-                    else:
-                        og_desc = soup.find("meta", property="og:description")
-                        if og_desc:
-                            content = og_desc.get("content")
-                            if isinstance(content, str):
-                                description = content.strip()
-                result.description = description
-
-                # Extract author
-                author = ""
-                if js_metadata.get("meta", {}).get("article:author"):
-                    author = js_metadata["meta"]["article:author"]
-                else:
-                    author_meta = soup.find("meta", attrs={"name": "author"})
-                    if author_meta:
-                        content = author_meta.get("content")
-                        if isinstance(content, str):
-                            author = content.strip()
-                result.author = author
-
-                # Extract published date
-                published_date = ""
-                if js_metadata.get("meta", {}).get("article:published_time"):
-                    published_date = js_metadata["meta"]["article:published_time"]
-                else:
-                    date_meta = soup.find("meta", property="article:published_time")
-                    if date_meta:
-                        content = date_meta.get("content")
-                        if isinstance(content, str):
-                            published_date = content.strip()
-                result.published_date = published_date
-
-                # Store metadata
-                result.metadata = js_metadata.get("meta", {})
-
-                # Set content
-                logger.debug("Setting final content...")
-                result.main_content = markdown_content or ""
-                result.length = len(result.main_content)
-                logger.debug("Content extraction completed")
-
             elapsed_time = time.time() - start_time
             logger.info(
-                f"Playwright webpage content extraction completed successfully in {elapsed_time:.2f}s: "
-                f"extracted {len(result.main_content)} chars, "
-                f"{len(result.links)} links, {len(result.images)} images, "
-                f"{len(result.headings)} headings"
+                "Playwright webpage content extraction completed successfully in {:.2f}s: "
+                "extracted {} chars, {} links, {} images, {} headings",
+                elapsed_time,
+                len(result.main_content),
+                len(result.links),
+                len(result.images),
+                len(result.headings),
             )
 
+        except httpx.HTTPStatusError as e:
+            # Only the render=False path lets static fetch errors through
+            result.error = f"HTTP error fetching page: {e.response.status_code}"
+            logger.error("HTTP error fetching {}: {}", url, e.response.status_code)
+        except httpx.TimeoutException:
+            result.error = f"Timeout fetching page after {timeout} seconds"
+            logger.error("Timeout fetching {} after {}s", url, timeout)
+        except httpx.HTTPError as e:
+            result.error = f"Error fetching page: {e}"
+            logger.error("Error fetching {}: {}", url, e)
+        except NonHtmlResponseError as e:
+            result.error = str(e)
+            logger.error("Cannot extract {}: {}", url, e)
         except TimeoutError as e:
+            page_reusable = False
             elapsed_time = time.time() - start_time
             result.error = (
                 f"Playwright extraction timeout after {elapsed_time:.2f}s: {str(e)}"
             )
             logger.error(
-                f"Timeout extracting content from {url} after {elapsed_time:.2f}s: {e}"
+                "Timeout extracting content from {} after {:.2f}s: {}",
+                url,
+                elapsed_time,
+                e,
             )
         except Exception as e:
+            page_reusable = False
             elapsed_time = time.time() - start_time
             result.error = (
                 f"Playwright extraction error after {elapsed_time:.2f}s: {str(e)}"
             )
             logger.exception(
-                f"Unexpected error extracting content from {url} after {elapsed_time:.2f}s"
+                "Unexpected error extracting content from {} after {:.2f}s",
+                url,
+                elapsed_time,
             )
         finally:
             if page_instance:
-                await page_instance.close()
+                await self._release_page(page_instance, page_reusable)
 
         return result
 
+    async def reset_context(self) -> None:
+        """
+        Close the browser context but keep the browser connection for reuse.
+
+        Cookies, storage and open pages are discarded; the next extraction
+        creates a fresh context on the already connected browser.
+        """
+        self._idle_pages.clear()  # Closed together with the context
+        if self._context:
+            await self._context.close()
+            self._context = None
+
     async def stop(self) -> None:
         """Stop the browser completely - call this on application shutdown."""
+        self._idle_pages.clear()
         if self._context:
             await self._context.close()
             self._context = None
@@ -1054,3 +1489,6 @@ class PlaywrightWebpageContentService(WebpageContentService):
         if self._playwright:
             await self._playwright.stop()
             self._playwright = None
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
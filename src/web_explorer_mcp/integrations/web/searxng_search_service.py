@@ -1,5 +1,8 @@
 """Web search service implementation using SearxNG."""
 
+import asyncio
+from typing import Any
+
 import httpx
 from loguru import logger
 
@@ -12,6 +15,99 @@ class SearxngWebSearchService(WebSearchService):
 
     def __init__(self, searxng_url: str = "http://127.0.0.1:9011"):
         self.searxng_url = searxng_url
+        self._client: httpx.AsyncClient | None = None
+        # SearxNG requests in flight, keyed by (query, page); identical
+        # concurrent searches await the same request instead of sending their own
+        self._in_flight: dict[tuple[str, int], asyncio.Task[list[Any]]] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps connections to SearxNG alive between
+        searches instead of reconnecting on every call. HTTP/2 is negotiated
+        for https instances, multiplexing concurrent searches over a single
+        connection; plain http instances keep using HTTP/1.1.
+
+        Returns:
+            Shared httpx.AsyncClient instance
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def _request_results(self, query: str, page: int, timeout: int) -> list[Any]:
+        """
+        Request one page of raw results from SearxNG.
+
+        Args:
+            query: Stripped search query
+            page: Page number (1-based)
+            timeout: Request timeout in seconds
+
+        Returns:
+            Raw result dicts from the SearxNG JSON response
+
+        Raises:
+            httpx.HTTPError: If the request fails or SearxNG returns an error status
+        """
+        # Construct SearxNG search URL
+        searxng_search_url = f"{self.searxng_url.rstrip('/')}/search"
+
+        # Parameters for SearxNG API
+        search_params = {"q": query, "format": "json", "pageno": page}
+
+        logger.debug("Performing SearxNG search: {}, page {}", query, page)
+
+        client = self._get_client()
+        response = await client.get(
+            searxng_search_url, params=search_params, timeout=timeout
+        )
+        response.raise_for_status()
+
+        search_data = response.json()
+
+        # Extract results from SearxNG response
+        return search_data.get("results", [])
+
+    async def _fetch_results(self, query: str, page: int, timeout: int) -> list[Any]:
+        """
+        Get raw results from SearxNG, sharing the request with identical searches.
+
+        Callers searching the same query and page while a request is in
+        flight await that request rather than sending a duplicate; the first
+        caller's timeout applies to it. The request is shielded, so one
+        caller giving up does not cancel it for the others.
+
+        Args:
+            query: Stripped search query
+            page: Page number (1-based)
+            timeout: Request timeout in seconds
+
+        Returns:
+            Raw result dicts from the SearxNG JSON response
+
+        Raises:
+            httpx.HTTPError: If the request fails or SearxNG returns an error status
+        """
+        key = (query, page)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_results(query, page, timeout))
+            self._in_flight[key] = task
+
+            def forget(done: asyncio.Task[list[Any]]) -> None:
+                if self._in_flight.get(key) is done:
+                    del self._in_flight[key]
+
+            task.add_done_callback(forget)
+        else:
+            logger.debug("Joining in-flight SearxNG search: {}, page {}", query, page)
+
+        return await asyncio.shield(task)
 
     async def search(
         self,
@@ -55,61 +151,60 @@ class SearxngWebSearchService(WebSearchService):
             return result
 
         logger.info(
-            f"Starting web search: query='{query.strip()}', searxng_url='{self.searxng_url}', page={page}, page_size={page_size}, timeout={timeout}s"
+            "Starting web search: query='{}', searxng_url='{}', page={}, page_size={}, timeout={}s",
+            query.strip(),
+            self.searxng_url,
+            page,
+            page_size,
+            timeout,
         )
 
-        # Construct SearxNG search URL
-        searxng_search_url = f"{self.searxng_url.rstrip('/')}/search"
-
         try:
-            # Parameters for SearxNG API
-            search_params = {"q": query.strip(), "format": "json", "pageno": page}
-
-            logger.debug(f"Performing SearxNG search: {query}, page {page}")
-
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(searxng_search_url, params=search_params)
-                response.raise_for_status()
-
-                search_data = response.json()
-
-                # Extract results from SearxNG response
-                searxng_results = search_data.get("results", [])
-
-                # Apply client-side pagination
-                start_idx = 0
-                end_idx = min(len(searxng_results), page_size)
-                paged_results = searxng_results[start_idx:end_idx]
-
-                # Format results
-                formatted_results = []
-                for res in paged_results:
-                    formatted_results.append(
-                        SearchResult(
-                            title=res.get("title", ""),
-                            description=res.get("content", ""),
-                            url=res.get("url", ""),
-                        )
+            searxng_results = await self._fetch_results(query.strip(), page, timeout)
+
+            # Apply client-side pagination
+            start_idx = 0
+            end_idx = min(len(searxng_results), page_size)
+            paged_results = searxng_results[start_idx:end_idx]
+
+            # Format results
+            formatted_results = []
+            for res in paged_results:
+                formatted_results.append(
+                    SearchResult(
+                        title=res.get("title", ""),
+                        description=res.get("content", ""),
+                        url=res.get("url", ""),
                     )
+                )
 
-                result.total_results = len(searxng_results)
-                result.results = formatted_results
+            result.total_results = len(searxng_results)
+            result.results = formatted_results
 
-                logger.info(
-                    f"Web search completed successfully: found {len(searxng_results)} total results, returned {len(formatted_results)} for page {page}"
-                )
+            logger.info(
+                "Web search completed successfully: found {} total results, returned {} for page {}",
+                len(searxng_results),
+                len(formatted_results),
+                page,
+            )
 
         except httpx.ConnectError:
             result.error = f"Cannot connect to SearxNG ({self.searxng_url}). Make sure the service is running."
-            logger.error(f"Connection error to SearxNG at {self.searxng_url}")
+            logger.error("Connection error to SearxNG at {}", self.searxng_url)
         except httpx.HTTPStatusError as e:
             result.error = f"HTTP error from SearxNG: {e.response.status_code}"
-            logger.error(f"HTTP error from SearxNG: {e.response.status_code}")
+            logger.error("HTTP error from SearxNG: {}", e.response.status_code)
         except httpx.TimeoutException:
             result.error = f"Request timeout after {timeout} seconds"
             logger.error("Timeout error for SearxNG request")
         except Exception as e:
             result.error = f"Search error: {str(e)}"
-            logger.error(f"Unexpected error during search: {str(e)}")
+            logger.error("Unexpected error during search: {}", e)
 
         return result
+
+    async def stop(self) -> None:
+        """Close the shared HTTP client - call this on application shutdown."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
@@ -1,7 +1,20 @@
 """Pytest configuration and fixtures for web-explorer-mcp tests."""
 
+import json
+import os
+import time
+from pathlib import Path
+
 import pytest
 
+# On-disk cache of e2e tool results (see the ``cached_tool_result`` fixture)
+E2E_CACHE_DIR = Path(__file__).parent / ".cache"
+E2E_CACHE_TTL_SECONDS = int(os.getenv("E2E_CACHE_TTL", "86400"))
+
+# FAST_TESTS=1 skips collecting the e2e modules altogether, so fast lanes do
+# not even import them (``-m "not e2e"`` still imports and then deselects)
+collect_ignore_glob = ["test_e2e_*.py"] if os.getenv("FAST_TESTS") == "1" else []
+
 
 @pytest.fixture
 def sample_html():
@@ -82,9 +95,14 @@ def mock_webpage_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app_settings():
-    """Application settings fixture."""
+    """
+    Application settings fixture, built once per session.
+
+    Tests must treat it as read-only; construct AppSettings directly when a
+    test needs custom values or a different environment.
+    """
     from web_explorer_mcp.config.settings import AppSettings
 
     return AppSettings()
@@ -100,8 +118,80 @@ def reset_logger():
     logger.remove()  # Clean up after test
 
 
+@pytest.fixture(scope="session")
+async def web_explorer_service():
+    """
+    Session-wide web explorer service shared by all e2e tests.
+
+    The Playwright browser connection is opened lazily by the first test that
+    needs it and stays up for the whole session; it is only stopped once at
+    the end instead of being relaunched for every test. Tests run on the
+    session event loop (see asyncio_default_*_loop_scope in pyproject.toml)
+    so the connection stays usable across tests.
+    """
+    from web_explorer_mcp.entrypoints.mcp.server import web_explorer_service
+
+    try:
+        yield web_explorer_service
+    finally:
+        await web_explorer_service.stop()
+
+
+@pytest.fixture(scope="session")
+async def session_mcp_client(web_explorer_service):
+    """
+    MCP client shared by the whole test session.
+
+    Used by module- and session-scoped fixtures that fetch a page once and
+    share the tool result between several tests.
+    """
+    from tests.mcp_client import MCPClient
+    from web_explorer_mcp.entrypoints.mcp.server import mcp
+
+    client = MCPClient(mcp)
+    await client.connect()
+
+    try:
+        yield client
+    finally:
+        await client.disconnect()
+
+
+@pytest.fixture(scope="session")
+def cached_tool_result(session_mcp_client):
+    """
+    Call an MCP tool, reusing a result recorded on disk by a previous run.
+
+    Successful results are stored as JSON under ``tests/.cache/<name>.json``
+    and replayed while younger than ``E2E_CACHE_TTL`` seconds (one day by
+    default), so reruns skip Playwright and the network entirely. Set
+    ``E2E_REFRESH=1`` to force a live call and re-record the result.
+    """
+
+    async def call(name: str, tool_name: str, arguments: dict) -> dict:
+        cache_file = E2E_CACHE_DIR / f"{name}.json"
+        if (
+            not os.getenv("E2E_REFRESH")
+            and cache_file.exists()
+            and time.time() - cache_file.stat().st_mtime < E2E_CACHE_TTL_SECONDS
+        ):
+            return json.loads(cache_file.read_text(encoding="utf-8"))
+
+        result = await session_mcp_client.call_tool(tool_name, arguments)
+        data = result.get("data") or {}
+        # Batch tools wrap one result per URL; record only if all succeeded
+        if result.get("success") and not any(
+            item.get("error") for item in data.get("results", [data])
+        ):
+            E2E_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps(result), encoding="utf-8")
+        return result
+
+    return call
+
+
 @pytest.fixture(scope="function")
-async def mcp_client():
+async def mcp_client(web_explorer_service):
     """
     MCP client fixture for e2e testing.
 
@@ -111,12 +201,11 @@ async def mcp_client():
     Scope: function - each test gets its own isolated client instance
     to avoid state pollution and resource conflicts between tests.
 
-    IMPORTANT: This fixture also ensures proper cleanup of Playwright resources
-    by closing the browser context after each test to prevent WebSocket connection
-    issues and resource leaks between sequential test runs.
+    Between tests only the browser context is reset (cookies, storage and
+    pages), which is much cheaper than reconnecting to the Playwright server.
     """
     from tests.mcp_client import MCPClient
-    from web_explorer_mcp.entrypoints.mcp.server import mcp, web_explorer_service
+    from web_explorer_mcp.entrypoints.mcp.server import mcp
 
     client = MCPClient(mcp)
     await client.connect()
@@ -127,21 +216,20 @@ async def mcp_client():
         # Disconnect MCP client
         await client.disconnect()
 
-        # Critical: Fully stop Playwright service to prevent connection reuse issues
-        # This ensures each test starts with a completely fresh Playwright instance
-        # including new browser connection, context, and page
+        # Reset browser state but keep the connection for the next test.
+        # The content service may be wrapped by the result cache
         try:
             content_service = web_explorer_service._content_service  # type: ignore
-            if hasattr(content_service, "stop"):
-                await content_service.stop()  # type: ignore
-                import logging
-
-                logging.info("Playwright service stopped successfully after test")
+            content_service = getattr(
+                content_service, "_content_service", content_service
+            )
+            if hasattr(content_service, "reset_context"):
+                await content_service.reset_context()  # type: ignore
         except Exception as e:
             # Log but don't fail the test on cleanup errors
             import logging
 
-            logging.warning(f"Error stopping Playwright service: {e}")
+            logging.warning(f"Error resetting Playwright context: {e}")
 
 
 # Test markers
@@ -29,23 +29,111 @@ Note: Tests are marked as 'slow' with 60s timeout due to:
 - Complex page processing with dynamic content
 - Large HTML page with many elements
 
-Run individual tests to avoid sequential execution issues:
-  uv run pytest tests/test_e2e_webpage_content_tool_github_issues.py::<test_name> --timeout=120
+The page is fetched once per module by the ``github_issues_result`` fixture and
+the tool result is shared by all tests, so the file costs a single extraction.
+The result is also recorded under ``tests/.cache/`` and replayed on reruns; set
+``E2E_REFRESH=1`` to fetch the live page again.
+
+Run the e2e files in parallel, keeping each file's group on one worker:
+  uv run pytest -m e2e -n auto --dist=loadgroup
 """
 
 import re
+from collections.abc import Iterable
+from itertools import islice
 
 import pytest
 
-pytestmark = pytest.mark.e2e
+# Shared by every test in this file. The xdist group keeps them on one worker
+# (--dist=loadgroup), so the module-scoped fetch below still happens once.
+pytestmark = [
+    pytest.mark.e2e,
+    pytest.mark.slow,
+    pytest.mark.asyncio,
+    pytest.mark.timeout(60),
+    pytest.mark.xdist_group("github_issues"),
+]
 
 TEST_URL = "https://github.com/microsoft/playwright/issues"
 
+# Issue numbers as rendered in the list ("# 37813")
+ISSUE_NUM_RE = re.compile(r"#\s*\d{5}")
+# Any number, including thousands separators ("15,996")
+NUMBER_RE = re.compile(r"\d[\d,]*")
+# Link to a single issue (/microsoft/playwright/issues/NUMBER)
+ISSUE_URL_RE = re.compile(r"/microsoft/playwright/issues/\d+$")
+# Keyword groups below are each matched in a single regex pass over the content
+# instead of one substring scan per keyword.
+# Timestamp phrases next to each issue ("2 days ago", "opened on Oct 3")
+TIME_RE = re.compile(r"ago|yesterday|on (?:oct|sep|jan|feb)", re.IGNORECASE)
+# Interaction details ("1 linked PR", assignees, labels)
+INTERACTION_RE = re.compile(r"linked|pr|assignee|label", re.IGNORECASE)
+# Issue type tags in titles
+ISSUE_TAG_RE = re.compile(r"\[(?:Bug|Feature|Docs)\]")
+HEADING_TAG_RE = re.compile(r"\[(?:Bug|Feature|Docs|Question)\]")
+# The repository header and the Open/Closed counts come first in the content,
+# so checks on them only scan (and lowercase) this prefix. Checks that count
+# over the issues list keep scanning the full content.
+HEADER_CHARS = 5000
+
+
+@pytest.fixture(scope="module")
+async def github_issues_result(cached_tool_result):
+    """
+    Tool result for TEST_URL, fetched once and shared by all tests in this module.
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_basic_extraction(mcp_client):
+    max_chars only affects the paginated main_text, so the largest value used
+    by any test (15000, comprehensive check) serves all of them.
+    """
+    return await cached_tool_result(
+        "github_issues", "webpage_content_tool", {"url": TEST_URL, "max_chars": 15000}
+    )
+
+
+@pytest.fixture(scope="module")
+def link_urls(github_issues_result):
+    """URLs of all extracted links, read out of the shared result once."""
+    data = github_issues_result.get("data") or {}
+    return tuple(link.get("url", "") for link in data.get("links") or [])
+
+
+def _at_least(items: Iterable, n: int) -> bool:
+    """Check that items yields at least n elements, stopping at the n-th one."""
+    return sum(1 for _ in islice(items, n)) >= n
+
+
+def _count_at_least(pattern: re.Pattern, text: str, n: int) -> bool:
+    """Check that pattern matches text at least n times, stopping at the n-th match."""
+    return _at_least(pattern.finditer(text), n)
+
+
+def _is_author_link(url: str) -> bool:
+    """Check for a link to an author's issues (author: search filter)."""
+    return "author%3A" in url or "/issues?q=" in url
+
+
+def _is_page_link(url: str) -> bool:
+    """Check for a pagination link (page=NUMBER query parameter)."""
+    return "?page=" in url or "&page=" in url
+
+
+def _checked_data(result: dict) -> dict:
+    """Assert that the tool call and the extraction succeeded and return the data."""
+    __tracebackhide__ = True
+    assert result["success"] is True, f"Tool call failed: {result['error']}"
+    data = result["data"]
+    assert data["error"] is None, f"Extractor error: {data['error']}"
+    return data
+
+
+def _assert_min_len(items, n: int, what: str) -> None:
+    """Fail with a uniform message unless items has at least n elements."""
+    __tracebackhide__ = True
+    if len(items) < n:
+        pytest.fail(f"Should have at least {n} {what}, got: {len(items)}")
+
+
+async def test_github_issues_basic_extraction(github_issues_result):
     """
     E2E: Test basic content extraction from GitHub Issues page.
 
@@ -59,10 +147,7 @@ async def test_github_issues_basic_extraction(mcp_client):
     - Uses Playwright browser automation for content extraction
     - Processes complex dynamic page with JavaScript
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
-    assert data["error"] is None, f"Extractor error: {data['error']}"
+    data = _checked_data(github_issues_result)
 
     # Check title contains repository and section name
     assert data["title"], "Title should be extracted"
@@ -90,10 +175,7 @@ async def test_github_issues_basic_extraction(mcp_client):
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_list_extraction(mcp_client):
+async def test_github_issues_list_extraction(github_issues_result):
     """
     E2E: Test extraction of issues list from GitHub Issues page.
 
@@ -107,40 +189,32 @@ async def test_github_issues_list_extraction(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     content = data["main_content"]
-    content_lower = content.lower()
+    head_lower = content[:HEADER_CHARS].lower()
 
     # Check for issue numbers (GitHub format: # 12345 with space)
-    issue_numbers = re.findall(r"#\s*\d{5}", content)
-    assert len(issue_numbers) >= 10, (
+    assert _count_at_least(ISSUE_NUM_RE, content, 10), (
         f"Should extract at least 10 issue numbers (GitHub shows 25 per page), "
-        f"found: {len(issue_numbers)}"
+        f"found: {len(ISSUE_NUM_RE.findall(content))}"
     )
 
     # Check for issue type tags
-    assert any(tag in content for tag in ["[Bug]", "[Feature]", "[Docs]"]), (
+    assert ISSUE_TAG_RE.search(content), (
         "Should contain issue type tags like [Bug], [Feature], or [Docs]"
     )
 
     # Check for issue status
-    assert "Status: Open" in content or "open" in content_lower, (
-        "Should contain issue status information (Open)"
-    )
+    assert "open" in head_lower, "Should contain issue status information (Open)"
 
     # Check for repository reference
-    assert "microsoft/playwright" in content, (
+    assert "microsoft/playwright" in head_lower, (
         "Should reference the repository name 'microsoft/playwright'"
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_user_information(mcp_client):
+async def test_github_issues_user_information(github_issues_result, link_urls):
     """
     E2E: Test extraction of user information from GitHub Issues page.
 
@@ -156,9 +230,7 @@ async def test_github_issues_user_information(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     content = data["main_content"]
     content_lower = content.lower()
@@ -169,12 +241,9 @@ async def test_github_issues_user_information(mcp_client):
     # Check that multiple usernames are present
     # GitHub shows: "· username [link] opened on DATE" in the extracted content
     # The pattern may be simplified in extraction, so let's check for user links
-    link_urls = [link.get("url", "") for link in data.get("links", [])]
-    author_links = [
-        url for url in link_urls if "author%3A" in url or "/issues?q=" in url
-    ]
-    assert len(author_links) >= 5, (
-        f"Should find at least 5 author profile links, found: {len(author_links)}"
+    assert _at_least(filter(_is_author_link, link_urls), 5), (
+        f"Should find at least 5 author profile links, "
+        f"found: {sum(map(_is_author_link, link_urls))}"
     )
 
     # Also check that "opened on" pattern exists in content
@@ -183,10 +252,7 @@ async def test_github_issues_user_information(mcp_client):
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_links_extraction(mcp_client):
+async def test_github_issues_links_extraction(github_issues_result, link_urls):
     """
     E2E: Test extraction of links from GitHub Issues page.
 
@@ -200,50 +266,42 @@ async def test_github_issues_links_extraction(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     # Check for links
     assert data.get("links"), "Links should be extracted"
-    assert len(data["links"]) >= 20, (
-        f"Should have at least 20 links (issues, authors, navigation), "
-        f"got: {len(data['links'])}"
-    )
-
-    # Get all link URLs
-    link_urls = [link.get("url", "") for link in data["links"]]
-
-    # Check for issue links (pattern: /microsoft/playwright/issues/NUMBER)
-    issue_links = [
-        url
-        for url in link_urls
-        if "/microsoft/playwright/issues/" in url and url.split("/")[-1].isdigit()
-    ]
-    assert len(issue_links) >= 5, (
-        f"Should have at least 5 direct issue links, found: {len(issue_links)}"
+    _assert_min_len(data["links"], 20, "links (issues, authors, navigation)")
+
+    # Count link URLs of the checked categories in one pass
+    issue_links = 0  # pattern: /microsoft/playwright/issues/NUMBER
+    github_links = 0
+    for url in link_urls:
+        if "github.com" in url:
+            github_links += 1
+        if ISSUE_URL_RE.search(url):
+            issue_links += 1
+
+    # Check for issue links
+    assert issue_links >= 5, (
+        f"Should have at least 5 direct issue links, found: {issue_links}"
     )
 
     # Check for GitHub domain
-    github_links = [url for url in link_urls if "github.com" in url]
-    assert len(github_links) >= 15, (
-        f"Most links should be GitHub links, found: {len(github_links)}"
+    assert github_links >= 15, (
+        f"Most links should be GitHub links, found: {github_links}"
     )
 
     # Check for navigation links (Labels, Milestones)
     content = data["main_content"]
-    assert "Labels" in content or "/labels" in str(link_urls), (
+    assert "Labels" in content or any("/labels" in url for url in link_urls), (
         "Should have link to Labels section"
     )
-    assert "Milestones" in content or "/milestones" in str(link_urls), (
+    assert "Milestones" in content or any("/milestones" in url for url in link_urls), (
         "Should have link to Milestones section"
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_statistics_extraction(mcp_client):
+async def test_github_issues_statistics_extraction(github_issues_result):
     """
     E2E: Test extraction of statistics from GitHub Issues page.
 
@@ -262,35 +320,24 @@ async def test_github_issues_statistics_extraction(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     content = data["main_content"]
-    content_lower = content.lower()
+    head_lower = content[:HEADER_CHARS].lower()
 
     # Check for Open/Closed issue counts
-    assert "open" in content_lower, "Should display Open issues count"
-    assert "closed" in content_lower, "Should display Closed issues count"
+    assert "open" in head_lower, "Should display Open issues count"
+    assert "closed" in head_lower, "Should display Closed issues count"
 
     # Check for numeric statistics (counts in content)
     # GitHub shows counts like "548" for open, "15,996" for closed
-    numbers_in_content = re.findall(r"\d[\d,]*", content)
-    assert len(numbers_in_content) >= 20, (
+    assert _count_at_least(NUMBER_RE, content, 20), (
         f"Should find many numbers (issue numbers, counts, etc.), "
-        f"found: {len(numbers_in_content)}"
+        f"found: {len(NUMBER_RE.findall(content))}"
     )
 
     # Check for timestamps
-    time_indicators = [
-        "ago",
-        "hours ago",
-        "days ago",
-        "yesterday",
-        "on oct",
-        "on sep",
-    ]
-    assert any(indicator in content_lower for indicator in time_indicators), (
+    assert TIME_RE.search(content), (
         "Should contain timestamp information (when issues were opened)"
     )
 
@@ -298,19 +345,13 @@ async def test_github_issues_statistics_extraction(mcp_client):
     # Comment counts may not always be extracted, but we should have other indicators
     # such as PR links ("1 linked PR") or interaction elements
     # Let's check for general interaction-related text
-    has_interaction_info = any(
-        indicator in content_lower
-        for indicator in ["linked", "pr", "assignee", "label"]
-    )
+    has_interaction_info = INTERACTION_RE.search(content) is not None
     assert has_interaction_info, (
         "Should have interaction information (linked PRs, assignees, or labels)"
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_pagination_detection(mcp_client):
+async def test_github_issues_pagination_detection(github_issues_result, link_urls):
     """
     E2E: Test detection and extraction of pagination from GitHub Issues page.
 
@@ -330,39 +371,25 @@ async def test_github_issues_pagination_detection(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     content = data["main_content"]
 
-    # Check for page links in extracted links
-    link_urls = [link.get("url", "") for link in data.get("links", [])]
-
     # Look for pagination links (pattern: ?page=NUMBER)
     # GitHub uses page parameter in URLs for pagination
-    page_links = [url for url in link_urls if "?page=" in url or "&page=" in url]
+    has_page_links = any(map(_is_page_link, link_urls))
 
     # Note: Pagination may not be extracted if content is limited
     # Check if we have issue list which indicates multi-page capability
-    if len(page_links) >= 1:
-        # If we found page links, verify they are valid
-        assert len(page_links) >= 1, (
-            f"Should have at least one pagination link, found: {len(page_links)}"
-        )
-    else:
+    if not has_page_links:
         # If no page links found, it's acceptable as the page may show limited content
         # Just verify that the content suggests there are multiple issues
-        issue_numbers = re.findall(r"#\s*\d{5}", content)
-        assert len(issue_numbers) >= 5, (
+        assert _count_at_least(ISSUE_NUM_RE, content, 5), (
             "Should have multiple issues suggesting pagination capability"
         )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_headings_structure(mcp_client):
+async def test_github_issues_headings_structure(github_issues_result):
     """
     E2E: Test extraction of headings structure from GitHub Issues page.
 
@@ -381,52 +408,44 @@ async def test_github_issues_headings_structure(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     # Check for headings structure
     assert data.get("headings"), "Headings should be extracted"
-    assert len(data["headings"]) >= 10, (
-        f"Should have at least 10 headings (1 H1 + 1 H2 + many H3 for issues), "
-        f"got: {len(data['headings'])}"
-    )
-
-    # Extract heading levels and texts
-    h1_headings = [h for h in data["headings"] if h.get("level") == 1]
-    h2_headings = [h for h in data["headings"] if h.get("level") == 2]
-    h3_headings = [h for h in data["headings"] if h.get("level") == 3]
+    _assert_min_len(data["headings"], 10, "headings (1 H1 + 1 H2 + many H3 for issues)")
+
+    # Split heading texts by level and count tagged H3s in one pass
+    h1_texts, h2_count, h3_count, h3_tagged = [], 0, 0, 0
+    for heading in data["headings"]:
+        level = heading.get("level")
+        if level == 1:
+            h1_texts.append(heading.get("text", "").lower())
+        elif level == 2:
+            h2_count += 1
+        elif level == 3:
+            h3_count += 1
+            if HEADING_TAG_RE.search(heading.get("text", "")):
+                h3_tagged += 1
 
     # Check for main heading (H1)
-    assert len(h1_headings) >= 1, "Should have at least one H1 heading"
-    h1_texts = [h.get("text", "").lower() for h in h1_headings]
+    _assert_min_len(h1_texts, 1, "H1 headings")
     assert any("issues" in text for text in h1_texts), "H1 should contain 'Issues' text"
 
     # Check for section heading (H2)
-    assert len(h2_headings) >= 1, "Should have at least one H2 heading"
+    assert h2_count >= 1, "Should have at least one H2 heading"
 
     # Check for issue headings (H3) - one per issue
-    assert len(h3_headings) >= 10, (
-        f"Should have at least 10 H3 headings (one per issue), got: {len(h3_headings)}"
+    assert h3_count >= 10, (
+        f"Should have at least 10 H3 headings (one per issue), got: {h3_count}"
     )
 
     # Check that H3 headings contain issue type tags
-    h3_texts = [h.get("text", "") for h in h3_headings]
-    headings_with_tags = [
-        text
-        for text in h3_texts
-        if any(tag in text for tag in ["[Bug]", "[Feature]", "[Docs]", "[Question]"])
-    ]
-    assert len(headings_with_tags) >= 5, (
-        f"At least 5 H3 headings should contain issue type tags, "
-        f"found: {len(headings_with_tags)}"
+    assert h3_tagged >= 5, (
+        f"At least 5 H3 headings should contain issue type tags, found: {h3_tagged}"
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_metadata_extraction(mcp_client):
+async def test_github_issues_metadata_extraction(github_issues_result):
     """
     E2E: Test extraction of metadata from GitHub Issues page.
 
@@ -439,9 +458,7 @@ async def test_github_issues_metadata_extraction(mcp_client):
     - Makes real network request to GitHub
     - Uses Playwright browser automation for content extraction
     """
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     # Check metadata
     assert data.get("metadata"), "Metadata should be extracted"
@@ -459,10 +476,9 @@ async def test_github_issues_metadata_extraction(mcp_client):
         ), f"Description should contain relevant keywords, got: {description}"
 
 
-@pytest.mark.asyncio
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_github_issues_comprehensive_content_check(mcp_client):
+async def test_github_issues_comprehensive_content_check(
+    github_issues_result, link_urls
+):
     """
     E2E: Comprehensive test combining multiple aspects of GitHub Issues page.
 
@@ -481,18 +497,14 @@ async def test_github_issues_comprehensive_content_check(mcp_client):
     - Uses Playwright browser automation for content extraction
     - Performs comprehensive validation of extracted data
     """
-    result = await mcp_client.call_tool(
-        "webpage_content_tool", {"url": TEST_URL, "max_chars": 15000}
-    )
-    assert result["success"] is True, f"Tool call failed: {result['error']}"
-    data = result["data"]
+    data = _checked_data(github_issues_result)
 
     content = data["main_content"]
     content_lower = content.lower()
 
     # 1. Check issues are present
-    issue_numbers = re.findall(r"#\s*\d{5}", content)
-    assert len(issue_numbers) >= 10, "Should have multiple issues"
+    has_many_issues = _count_at_least(ISSUE_NUM_RE, content, 10)
+    assert has_many_issues, "Should have multiple issues"
 
     # 2. Check user information
     assert "opened" in content_lower, "Should have user actions"
@@ -500,7 +512,7 @@ async def test_github_issues_comprehensive_content_check(mcp_client):
 
     # 3. Check links
     links = data.get("links", [])
-    assert len(links) >= 20, "Should have many links"
+    _assert_min_len(links, 20, "links")
 
     # 4. Check statistics
     assert "open" in content_lower and "closed" in content_lower, (
@@ -508,27 +520,19 @@ async def test_github_issues_comprehensive_content_check(mcp_client):
     )
 
     # 5. Check pagination capability
-    link_urls = [link.get("url", "") for link in links]
-    page_links = [url for url in link_urls if "?page=" in url or "&page=" in url]
+    has_page_links = any(map(_is_page_link, link_urls))
     # Pagination links may not always be extracted, but we should have many issues
     # indicating multi-page content
-    if len(page_links) == 0:
+    if not has_page_links:
         # If no page links, at least verify we have many issues
-        assert len(issue_numbers) >= 10, (
-            "Should have many issues indicating multi-page content"
-        )
-    else:
-        assert len(page_links) >= 1, "Should have pagination links if extracted"
+        assert has_many_issues, "Should have many issues indicating multi-page content"
 
     # 6. Check headings structure
     headings = data.get("headings", [])
-    assert len(headings) >= 10, "Should have comprehensive heading structure"
+    _assert_min_len(headings, 10, "headings in a comprehensive structure")
 
     # 7. Check timestamps
-    time_indicators = ["ago", "yesterday", "on oct", "on sep", "on jan", "on feb"]
-    assert any(indicator in content_lower for indicator in time_indicators), (
-        "Should have timestamp information"
-    )
+    assert TIME_RE.search(content), "Should have timestamp information"
 
     # 8. Check repository branding
     assert "microsoft" in content_lower and "playwright" in content_lower, (
@@ -536,11 +540,7 @@ async def test_github_issues_comprehensive_content_check(mcp_client):
     )
 
     # 9. Check content length is substantial
-    assert len(content) >= 3000, (
-        f"Content should be comprehensive with all information, got {len(content)} chars"
-    )
+    _assert_min_len(content, 3000, "chars of comprehensive content")
 
     # 10. Check for issue status indicators
-    assert "Status: Open" in content or "status: open" in content_lower, (
-        "Should indicate issue status"
-    )
+    assert "status: open" in content_lower, "Should indicate issue status"
@@ -3,23 +3,80 @@ End-to-end tests for webpage_content_tool with Stack Overflow page.
 
 Tests extraction of question, answers, votes, users, comments, and other
 information from a famous Stack Overflow page about parsing HTML with regex.
+
+The page is fetched once per module by the ``stackoverflow_result`` fixture
+and the tool result is shared by all tests, which only make in-memory checks.
+The result is also recorded under ``tests/.cache/`` and replayed on reruns;
+set ``E2E_REFRESH=1`` to fetch the live page again.
+
+Run the e2e files in parallel, keeping each file's group on one worker:
+  uv run pytest -m e2e -n auto --dist=loadgroup
 """
 
+import re
+from urllib.parse import urlsplit
+
 import pytest
 
 # URL of the famous Stack Overflow page about parsing HTML with regex
 TEST_URL = "https://stackoverflow.com/questions/1732348/regex-match-open-tags-except-xhtml-self-contained-tags"
 
-pytestmark = pytest.mark.e2e
+# Indicator groups, each matched in a single regex pass over the lowercased
+# content instead of one substring scan per indicator
+USER_RE = re.compile(r"jeff|bob|community wiki|user")
+VOTE_RE = re.compile(r"vote|score|rating")  # "upvote" is implied by "vote"
+ACCEPTED_RE = re.compile(r"accept|✓|checkmark|best|correct")
+STATUS_RE = re.compile(r"protect|lock|closed|status")
+
+# Domains of the Stack Exchange network itself, subdomains included
+INTERNAL_DOMAINS = frozenset({"stackoverflow.com", "stackexchange.com"})
+
+# Shared by every test in this file. The xdist group keeps them on one worker
+# (--dist=loadgroup), so the module-scoped fetch below still happens once.
+pytestmark = [
+    pytest.mark.e2e,
+    pytest.mark.slow,
+    pytest.mark.asyncio,
+    pytest.mark.timeout(60),
+    pytest.mark.xdist_group("stackoverflow_regex"),
+]
+
+
+@pytest.fixture(scope="module")
+async def stackoverflow_result(cached_tool_result):
+    """Tool result for TEST_URL, fetched once and shared by all tests in this module."""
+    return await cached_tool_result(
+        "stackoverflow_regex", "webpage_content_tool", {"url": TEST_URL}
+    )
+
 
+@pytest.fixture(scope="module")
+def content_lower(stackoverflow_result):
+    """Lowercased main_content of the shared result, folded once for the module."""
+    data = stackoverflow_result.get("data") or {}
+    return (data.get("main_content") or "").lower()
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_basic_extraction(mcp_client):
+
+@pytest.fixture(scope="module")
+def link_urls(stackoverflow_result):
+    """URLs of all extracted links, read out of the shared result once."""
+    data = stackoverflow_result.get("data") or {}
+    return tuple(link.get("url", "") for link in data.get("links") or [])
+
+
+def _is_external(url: str) -> bool:
+    """Check for an absolute http(s) link outside the INTERNAL_DOMAINS."""
+    if not url.startswith(("http://", "https://")):
+        return False
+    host = (urlsplit(url).hostname or "").lower()
+    return not any(
+        host == domain or host.endswith("." + domain) for domain in INTERNAL_DOMAINS
+    )
+
+
+async def test_stackoverflow_basic_extraction(stackoverflow_result):
     """Test basic content extraction from Stack Overflow page."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True, "Tool execution should succeed"
     assert result["data"] is not None, "Should return data"
@@ -41,19 +98,15 @@ async def test_stackoverflow_basic_extraction(mcp_client):
     assert result["data"]["content_type"] == "qa"  # Stack Overflow is Q&A format
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_question_content(mcp_client):
+async def test_stackoverflow_question_content(stackoverflow_result, content_lower):
     """Test extraction of question content."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     main_content = result["data"]["main_content"]
 
     # Check question content is present
-    assert "need to match all of these opening tags" in main_content.lower()
+    assert "need to match all of these opening tags" in content_lower
     assert "<p>" in main_content
     assert '<a href="foo">' in main_content
 
@@ -65,45 +118,29 @@ async def test_stackoverflow_question_content(mcp_client):
     assert "([a-z]+)" in main_content or "[a-z]" in main_content
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_tags_extraction(mcp_client):
+async def test_stackoverflow_tags_extraction(stackoverflow_result, content_lower):
     """Test extraction of Stack Overflow tags."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check that tags are present in content (typically near question)
-    content_lower = main_content.lower()
     assert "html" in content_lower
     assert "regex" in content_lower
     assert "xhtml" in content_lower
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_answers_extraction(mcp_client):
+async def test_stackoverflow_answers_extraction(stackoverflow_result, content_lower):
     """Test extraction of answers content."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check famous answer content (bobince's legendary answer)
-    assert (
-        "can't parse" in main_content.lower() or "cannot parse" in main_content.lower()
-    )
-    assert (
-        "regular expression" in main_content.lower() or "regex" in main_content.lower()
-    )
+    assert "can't parse" in content_lower or "cannot parse" in content_lower
+    assert "regular expression" in content_lower or "regex" in content_lower
 
     # Check for other notable answer phrases
-    content_lower = main_content.lower()
     assert (
         "xml parser" in content_lower
         or "html parser" in content_lower
@@ -112,87 +149,56 @@ async def test_stackoverflow_answers_extraction(mcp_client):
 
     # Check that multiple answers are present (look for answer indicators)
     # Answers typically have "answered" or user information
-    assert main_content.count("answer") > 5 or main_content.count("Answer") > 5
+    assert content_lower.count("answer") > 5
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_users_extraction(mcp_client):
+async def test_stackoverflow_users_extraction(stackoverflow_result, content_lower):
     """Test extraction of user names from Stack Overflow page."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check for notable users on this page
     # Jeff (original asker), bobince (famous answer), Kaitlin Duck Sherwood, etc.
-    content_lower = main_content.lower()
-
     # At least some user names should be present
-    user_indicators = ["jeff", "bob", "community wiki", "user"]
-    found_users = sum(1 for indicator in user_indicators if indicator in content_lower)
-    assert found_users >= 2, "Should find multiple user indicators"
+    found_users = set(USER_RE.findall(content_lower))
+    assert len(found_users) >= 2, "Should find multiple user indicators"
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_voting_indicators(mcp_client):
+async def test_stackoverflow_voting_indicators(stackoverflow_result, content_lower):
     """Test presence of voting indicators in content."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check for voting-related content
-    content_lower = main_content.lower()
-    voting_indicators = ["vote", "upvote", "score", "rating"]
-    found_voting = any(indicator in content_lower for indicator in voting_indicators)
+    found_voting = VOTE_RE.search(content_lower) is not None
     assert found_voting, "Should find voting-related indicators"
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_views_indicator(mcp_client):
+async def test_stackoverflow_views_indicator(stackoverflow_result, content_lower):
     """Test presence of view count indicators."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check for view count indicators
-    content_lower = main_content.lower()
     assert "view" in content_lower or "times" in content_lower, "Should mention views"
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_comments_indicators(mcp_client):
+async def test_stackoverflow_comments_indicators(stackoverflow_result, content_lower):
     """Test presence of comment indicators."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check for comment indicators
-    content_lower = main_content.lower()
     assert "comment" in content_lower, "Should mention comments"
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_links_extraction(mcp_client):
+async def test_stackoverflow_links_extraction(stackoverflow_result, link_urls):
     """Test extraction of links from Stack Overflow page."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     assert "links" in result["data"]
@@ -200,9 +206,6 @@ async def test_stackoverflow_links_extraction(mcp_client):
     links = result["data"]["links"]
     assert len(links) > 0, "Should extract links"
 
-    # Check for Stack Overflow specific links
-    link_urls = [link.get("url", "") for link in links]
-
     # Should have internal Stack Overflow links
     assert any("stackoverflow.com" in url for url in link_urls), (
         "Should have Stack Overflow links"
@@ -214,41 +217,24 @@ async def test_stackoverflow_links_extraction(mcp_client):
         assert "text" in link or "title" in link
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_external_links(mcp_client):
+async def test_stackoverflow_external_links(stackoverflow_result, link_urls):
     """Test detection of external links in answers."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     assert "links" in result["data"]
 
-    links = result["data"]["links"]
-    link_urls = [link.get("url", "") for link in links]
-
     # Stack Overflow answers often contain external reference links
-    # Check for external domains (not stackoverflow.com or stackexchange.com)
-    external_links = [
-        url
-        for url in link_urls
-        if url
-        and ("http://" in url or "https://" in url)
-        and "stackoverflow.com" not in url
-        and "stackexchange.com" not in url
-    ]
-
-    assert len(external_links) > 0, "Should find external reference links"
-
-
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_metadata_extraction(mcp_client):
+    # Check for external domains (not stackoverflow.com or stackexchange.com),
+    # stopping at the first one found
+    has_external_links = any(map(_is_external, link_urls))
+
+    assert has_external_links, "Should find external reference links"
+
+
+async def test_stackoverflow_metadata_extraction(stackoverflow_result):
     """Test extraction of page metadata."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     assert "metadata" in result["data"]
@@ -260,13 +246,9 @@ async def test_stackoverflow_metadata_extraction(mcp_client):
     assert "author" in result["data"] or "author" in metadata or "og:author" in metadata
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_headings_structure(mcp_client):
+async def test_stackoverflow_headings_structure(stackoverflow_result):
     """Test extraction of heading structure."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     assert "headings" in result["data"]
@@ -285,13 +267,9 @@ async def test_stackoverflow_headings_structure(mcp_client):
     assert "answer" in heading_texts_lower or "comment" in heading_texts_lower
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_images_extraction(mcp_client):
+async def test_stackoverflow_images_extraction(stackoverflow_result):
     """Test extraction of images (user avatars, etc.)."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     assert "images" in result["data"]
@@ -308,31 +286,21 @@ async def test_stackoverflow_images_extraction(mcp_client):
             assert "url" in img or "src" in img
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_code_blocks(mcp_client):
+async def test_stackoverflow_code_blocks(stackoverflow_result, content_lower):
     """Test that code blocks are preserved in content."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     main_content = result["data"]["main_content"]
 
     # Stack Overflow questions and answers typically contain code blocks
     # Check for code-related markers
-    assert (
-        "code" in main_content.lower() or "<" in main_content or "regex" in main_content
-    )
+    assert "code" in content_lower or "<" in main_content or "regex" in main_content
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_page_length(mcp_client):
+async def test_stackoverflow_page_length(stackoverflow_result):
     """Test that significant content is extracted."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     assert "length" in result["data"]
@@ -344,23 +312,16 @@ async def test_stackoverflow_page_length(mcp_client):
     )
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_accepted_answer_indicator(mcp_client):
+async def test_stackoverflow_accepted_answer_indicator(
+    stackoverflow_result, content_lower
+):
     """Test detection of accepted answer indicator."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
-    main_content = result["data"]["main_content"]
 
     # Check for accepted answer indicators
-    content_lower = main_content.lower()
-    accepted_indicators = ["accept", "✓", "checkmark", "best", "correct"]
-    found_accepted = any(
-        indicator in content_lower for indicator in accepted_indicators
-    )
+    found_accepted = ACCEPTED_RE.search(content_lower) is not None
 
     # This is a popular question, likely has accepted answer
     # But we're lenient as the indicator might be visual-only
@@ -371,13 +332,9 @@ async def test_stackoverflow_accepted_answer_indicator(mcp_client):
         assert "answer" in content_lower
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_pagination_info(mcp_client):
+async def test_stackoverflow_pagination_info(stackoverflow_result):
     """Test extraction of pagination information."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
 
@@ -392,23 +349,15 @@ async def test_stackoverflow_pagination_info(mcp_client):
             assert pagination["next_page"] is not None
 
 
-@pytest.mark.asyncio
-@pytest.mark.e2e
-@pytest.mark.slow
-@pytest.mark.timeout(60)
-async def test_stackoverflow_question_status(mcp_client):
+async def test_stackoverflow_question_status(stackoverflow_result, content_lower):
     """Test detection of question status (protected, locked, etc.)."""
-    result = await mcp_client.call_tool("webpage_content_tool", {"url": TEST_URL})
+    result = stackoverflow_result
 
     assert result["success"] is True
     main_content = result["data"]["main_content"]
 
-    # This famous question is protected
-    content_lower = main_content.lower()
-
-    # Check for status indicators
-    status_indicators = ["protect", "lock", "closed", "status"]
-    _found_status = any(indicator in content_lower for indicator in status_indicators)
+    # This famous question is protected, check for status indicators
+    _found_status = STATUS_RE.search(content_lower) is not None
 
     # At minimum, check that the page loaded properly
     assert len(main_content) > 500, "Should have substantial content"
@@ -1,11 +1,22 @@
 """Integration tests for the web explorer MCP package."""
 
+import contextlib
+import importlib.util
+
 import pytest
+from fastmcp import FastMCP
 
 from web_explorer_mcp import integrations
 from web_explorer_mcp.config import settings
+from web_explorer_mcp.config.logging_config import logging_config
+from web_explorer_mcp.config.settings import LoggingSettings
 from web_explorer_mcp.entrypoints import mcp
+from web_explorer_mcp.entrypoints.mcp import server
 from web_explorer_mcp.integrations import web
+from web_explorer_mcp.integrations.web import (
+    PlaywrightWebpageContentService,
+    SearxngWebSearchService,
+)
 
 
 class TestPackageImports:
@@ -31,19 +42,14 @@ class TestPackageImports:
         """Test that entrypoints package can be imported."""
         assert mcp is not None
         # Check that server module exists
-        from web_explorer_mcp.entrypoints.mcp import server
-
         assert server is not None
 
 
 class TestIntegrationWorkflow:
     """Integration tests for complete workflows."""
 
-    def test_settings_creation(self):
+    def test_settings_creation(self, app_settings):
         """Test that settings can be created and used."""
-        from web_explorer_mcp.config.settings import AppSettings
-
-        app_settings = AppSettings()
         assert app_settings is not None
 
         # Test that all sub-settings are accessible
@@ -53,11 +59,6 @@ class TestIntegrationWorkflow:
 
     def test_extractor_imports(self):
         """Test that new services can be imported and instantiated."""
-        from web_explorer_mcp.integrations.web import (
-            PlaywrightWebpageContentService,
-            SearxngWebSearchService,
-        )
-
         # Classes should be importable
         assert PlaywrightWebpageContentService is not None
         assert SearxngWebSearchService is not None
@@ -65,21 +66,15 @@ class TestIntegrationWorkflow:
     @pytest.mark.integration
     def test_mcp_server_creation(self):
         """Test that MCP server can be created."""
-        from fastmcp import FastMCP
-
-        from web_explorer_mcp.entrypoints.mcp.server import mcp
-
-        assert mcp is not None
+        assert server.mcp is not None
         # Check that it's a FastMCP instance
-        assert isinstance(mcp, FastMCP)
-        assert mcp.name == "Web Explorer MCP"
+        assert isinstance(server.mcp, FastMCP)
+        assert server.mcp.name == "Web Explorer MCP"
 
-    def test_logging_config_application(self):
+    def test_logging_config_application(self, tmp_path):
         """Test that logging configuration can be applied."""
-        from web_explorer_mcp.config.logging_config import logging_config
-        from web_explorer_mcp.config.settings import LoggingSettings
-
-        settings = LoggingSettings()
+        # Log into the test's own directory, not a shared ./app.log
+        settings = LoggingSettings(log_file_path=str(tmp_path / "app.log"))
         # Should not raise an exception
         try:
             logging_config(settings)
@@ -95,10 +90,6 @@ class TestErrorHandling:
     def test_invalid_settings_creation(self):
         """Test that invalid settings are handled."""
         # Should handle invalid log format gracefully during creation
-        import contextlib
-
-        from web_explorer_mcp.config.settings import LoggingSettings
-
         with contextlib.suppress(Exception):
             invalid_settings = LoggingSettings(log_file_format="invalid")
             # If it gets here, validation might be lazy
@@ -106,8 +97,6 @@ class TestErrorHandling:
 
     def test_missing_dependencies(self):
         """Test behavior when dependencies might be missing."""
-        import importlib.util
-
         # Test that key dependencies are available
         dependencies = ["httpx", "bs4", "fastmcp", "pydantic"]
         for dep in dependencies:
@@ -120,11 +109,9 @@ class TestErrorHandling:
 class TestConfigurationValidation:
     """Test configuration validation."""
 
-    def test_default_configuration(self):
+    def test_default_configuration(self, app_settings):
         """Test that default configuration is valid."""
-        from web_explorer_mcp.config.settings import AppSettings
-
-        settings = AppSettings()
+        settings = app_settings
 
         # Validate key settings have reasonable defaults
         assert settings.web_search.searxng_url.startswith("http")
@@ -133,11 +120,9 @@ class TestConfigurationValidation:
         assert settings.webpage.max_chars > 0
         assert settings.webpage.timeout > 0
 
-    def test_configuration_types(self):
+    def test_configuration_types(self, app_settings):
         """Test that configuration values have correct types."""
-        from web_explorer_mcp.config.settings import AppSettings
-
-        settings = AppSettings()
+        settings = app_settings
 
         # Type checks
         assert isinstance(settings.debug, bool)
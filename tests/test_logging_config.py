@@ -1,93 +1,90 @@
-import os
 import sys
-import tempfile
 from unittest.mock import patch
 
+import pytest
+
 from web_explorer_mcp.config.logging_config import logging_config
 from web_explorer_mcp.config.settings import LoggingSettings
 
 
+@pytest.fixture
+def temp_log_file(tmp_path):
+    """Log file path in the test's temporary directory, unique per test and worker."""
+    return str(tmp_path / "test.log")
+
+
+def _handler_calls(mock_logger, path=None):
+    """
+    Split logger.add calls into console and file handler calls in one pass.
+
+    A call is a file handler call when its sink is path, or when path is None,
+    any sink other than sys.stdout.
+    """
+    console_calls, file_calls = [], []
+    for call in mock_logger.add.call_args_list:
+        if not call.args:
+            continue
+        sink = call.args[0]
+        if sink is sys.stdout:
+            console_calls.append(call)
+        elif path is None or sink == path:
+            file_calls.append(call)
+    return console_calls, file_calls
+
+
 class TestLoggingConfig:
     """Unit tests for logging configuration."""
 
     @patch("web_explorer_mcp.config.logging_config.logger")
-    def test_logging_config_text_format(self, mock_logger):
+    def test_logging_config_text_format(self, mock_logger, temp_log_file):
         """Test logging configuration with text format."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_log_file = temp_file.name
-
-        try:
-            settings = LoggingSettings(
-                log_to_console=True,
-                console_log_level="DEBUG",
-                log_to_file=True,
-                file_log_level="INFO",
-                log_file_path=temp_log_file,
-                log_file_format="text",
-            )
+        settings = LoggingSettings(
+            log_to_console=True,
+            console_log_level="DEBUG",
+            log_to_file=True,
+            file_log_level="INFO",
+            log_file_path=temp_log_file,
+            log_file_format="text",
+        )
 
-            logging_config(settings)
+        logging_config(settings)
 
-            # Verify logger.remove() was called
-            mock_logger.remove.assert_called_once()
+        # Verify logger.remove() was called
+        mock_logger.remove.assert_called_once()
 
-            # Verify add was called at least twice (console + file)
-            assert mock_logger.add.call_count >= 2
+        # Verify add was called at least twice (console + file)
+        assert mock_logger.add.call_count >= 2
 
-            # Check console handler call
-            console_calls = [
-                call
-                for call in mock_logger.add.call_args_list
-                if len(call[0]) > 0 and call[0][0] == sys.stdout
-            ]
-            assert len(console_calls) >= 1
+        console_calls, file_calls = _handler_calls(mock_logger, temp_log_file)
 
-            # Check file handler call
-            file_calls = [
-                call
-                for call in mock_logger.add.call_args_list
-                if len(call[0]) > 0 and temp_log_file in str(call[0])
-            ]
-            assert len(file_calls) == 1
+        # Check console handler call
+        assert len(console_calls) >= 1
 
-        finally:
-            if os.path.exists(temp_log_file):
-                os.unlink(temp_log_file)
+        # Check file handler call
+        assert len(file_calls) == 1
 
     @patch("web_explorer_mcp.config.logging_config.logger")
-    def test_logging_config_json_format(self, mock_logger):
+    def test_logging_config_json_format(self, mock_logger, temp_log_file):
         """Test logging configuration with JSON format."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_log_file = temp_file.name
-
-        try:
-            settings = LoggingSettings(
-                log_to_console=True,
-                console_log_level="WARNING",
-                log_to_file=True,
-                file_log_level="ERROR",
-                log_file_path=temp_log_file,
-                log_file_format="json",
-            )
-
-            logging_config(settings)
+        settings = LoggingSettings(
+            log_to_console=True,
+            console_log_level="WARNING",
+            log_to_file=True,
+            file_log_level="ERROR",
+            log_file_path=temp_log_file,
+            log_file_format="json",
+        )
 
-            # Verify file handler was added with JSON format
-            file_calls = [
-                call
-                for call in mock_logger.add.call_args_list
-                if temp_log_file in str(call)
-            ]
-            assert len(file_calls) == 1
+        logging_config(settings)
 
-            # Check that JSON format was used (serialize=True)
-            file_call = file_calls[0]
-            kwargs = file_call[1]
-            assert kwargs.get("serialize") is True
+        # Verify file handler was added with JSON format
+        _, file_calls = _handler_calls(mock_logger, temp_log_file)
+        assert len(file_calls) == 1
 
-        finally:
-            if os.path.exists(temp_log_file):
-                os.unlink(temp_log_file)
+        # Check that JSON format was used (serialize=True)
+        file_call = file_calls[0]
+        kwargs = file_call[1]
+        assert kwargs.get("serialize") is True
 
     @patch("web_explorer_mcp.config.logging_config.logger")
     def test_logging_config_no_file(self, mock_logger):
@@ -104,13 +101,7 @@ class TestLoggingConfig:
         logging_config(settings)
 
         # Verify only console handler was added
-        calls = mock_logger.add.call_args_list
-        console_calls = [
-            call for call in calls if len(call[0]) > 0 and call[0][0] == sys.stdout
-        ]
-        file_calls = [
-            call for call in calls if len(call[0]) > 0 and call[0][0] != sys.stdout
-        ]
+        console_calls, file_calls = _handler_calls(mock_logger)
 
         assert len(console_calls) >= 1
         assert len(file_calls) == 0
@@ -129,11 +120,12 @@ class TestLoggingConfig:
             assert "Invalid log_file_format" in str(e)
             assert "Use 'text' or 'json'" in str(e)
 
-    def test_logging_config_function_signature(self):
+    def test_logging_config_function_signature(self, temp_log_file):
         """Test that logging_config function accepts LoggingSettings."""
         import contextlib
 
-        settings = LoggingSettings()
+        # Log into the test's own directory, not a shared ./app.log
+        settings = LoggingSettings(log_file_path=temp_log_file)
         # Function should not raise when called with valid settings
         with contextlib.suppress(Exception):
             logging_config(settings)
@@ -146,11 +138,7 @@ class TestLoggingConfig:
         logging_config(settings)
 
         # Find console handler call
-        console_calls = [
-            call
-            for call in mock_logger.add.call_args_list
-            if len(call[0]) > 0 and call[0][0] == sys.stdout
-        ]
+        console_calls, _ = _handler_calls(mock_logger)
         assert len(console_calls) >= 1
 
         call_args, call_kwargs = console_calls[0]
@@ -159,39 +147,27 @@ class TestLoggingConfig:
         assert "format" in call_kwargs
 
     @patch("web_explorer_mcp.config.logging_config.logger")
-    def test_logging_config_file_handler_setup(self, mock_logger):
+    def test_logging_config_file_handler_setup(self, mock_logger, temp_log_file):
         """Test that file handler is configured correctly."""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_log_file = temp_file.name
+        settings = LoggingSettings(
+            log_to_file=True,
+            file_log_level="WARNING",
+            log_file_path=temp_log_file,
+            log_file_format="text",
+        )
 
-        try:
-            settings = LoggingSettings(
-                log_to_file=True,
-                file_log_level="WARNING",
-                log_file_path=temp_log_file,
-                log_file_format="text",
-            )
+        logging_config(settings)
 
-            logging_config(settings)
+        # Find file handler call
+        _, file_calls = _handler_calls(mock_logger, temp_log_file)
+        assert len(file_calls) == 1
 
-            # Find file handler call
-            file_calls = [
-                call
-                for call in mock_logger.add.call_args_list
-                if temp_log_file in str(call)
-            ]
-            assert len(file_calls) == 1
-
-            call_args, call_kwargs = file_calls[0]
-            assert call_args[0] == temp_log_file
-            assert call_kwargs["level"] == "WARNING"
-            assert "rotation" in call_kwargs
-            assert "retention" in call_kwargs
-            assert call_kwargs["enqueue"] is True
-
-        finally:
-            if os.path.exists(temp_log_file):
-                os.unlink(temp_log_file)
+        call_args, call_kwargs = file_calls[0]
+        assert call_args[0] == temp_log_file
+        assert call_kwargs["level"] == "WARNING"
+        assert "rotation" in call_kwargs
+        assert "retention" in call_kwargs
+        assert call_kwargs["enqueue"] is True
 
     @patch("web_explorer_mcp.config.logging_config.logger")
     def test_logging_config_removes_existing_handlers(self, mock_logger):
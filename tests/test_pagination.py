@@ -1,20 +1,53 @@
 """Unit tests for pagination utility function."""
 
+import re
+
 import pytest
 
 from web_explorer_mcp.business.services import paginate_content
 
+# Test inputs, built once at import instead of in every test run
+CONTENT_100 = "A" * 100  # Exactly 1 page of 100 chars
+CONTENT_250 = "A" * 250  # 3 pages of 100 chars, the last one half full
+CONTENT_200 = "A" * 200  # Exactly 2 pages of 100 chars
+CONTENT_10K = "A" * 10000  # Large content
+UNICODE_CONTENT = "Привет мир! " * 50  # Unicode text
+
+# Expected ValueError messages, compiled once for pytest.raises(match=...)
+PAGE_ERROR_RE = re.compile("Page number must be 1 or greater")
+MAX_CHARS_ERROR_RE = re.compile("max_chars must be positive")
+
 
 class TestPaginateContent:
     """Test cases for paginate_content utility."""
 
-    def test_empty_content(self):
-        """Test pagination with empty content."""
-        text, total_pages, has_next = paginate_content("", max_chars=100, page=1)
-
-        assert text == ""
-        assert total_pages == 0
-        assert has_next is False
+    @pytest.mark.parametrize(
+        ("content", "max_chars", "page", "expected_len", "expected_pages", "has_more"),
+        [
+            pytest.param("", 100, 1, 0, 0, False, id="empty_content"),
+            # 100 chars + "..." on every page but the last
+            pytest.param(CONTENT_250, 100, 1, 103, 3, True, id="multi_page_first"),
+            pytest.param(CONTENT_250, 100, 2, 103, 3, True, id="multi_page_middle"),
+            pytest.param(CONTENT_250, 100, 3, 50, 3, False, id="multi_page_last"),
+            pytest.param(CONTENT_200, 100, 1, 103, 2, True, id="exact_boundary_first"),
+            pytest.param(CONTENT_200, 100, 2, 100, 2, False, id="exact_boundary_last"),
+            # Requesting a page beyond the available ones returns no text
+            pytest.param(CONTENT_100, 100, 5, 0, 1, False, id="page_out_of_range"),
+            pytest.param(CONTENT_10K, 5000, 1, 5003, 2, True, id="default_max_chars"),
+        ],
+    )
+    def test_page_slices(
+        self, content, max_chars, page, expected_len, expected_pages, has_more
+    ):
+        """Test page length, page count and continuation marker per page."""
+        text, total_pages, has_next = paginate_content(
+            content, max_chars=max_chars, page=page
+        )
+
+        assert len(text) == expected_len
+        assert text.endswith("...") is has_more
+        assert total_pages == expected_pages
+        assert has_next is has_more
 
     def test_single_page_content(self):
         """Test content that fits in a single page."""
@@ -25,88 +58,25 @@ class TestPaginateContent:
         assert total_pages == 1
         assert has_next is False
 
-    def test_multi_page_content_first_page(self):
-        """Test first page of multi-page content."""
-        content = "A" * 250  # 250 chars
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=1)
-
-        assert len(text) == 103  # 100 chars + "..."
-        assert text.endswith("...")
-        assert total_pages == 3
-        assert has_next is True
-
-    def test_multi_page_content_middle_page(self):
-        """Test middle page of multi-page content."""
-        content = "A" * 250  # 250 chars
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=2)
-
-        assert len(text) == 103  # 100 chars + "..."
-        assert text.endswith("...")
-        assert total_pages == 3
-        assert has_next is True
-
-    def test_multi_page_content_last_page(self):
-        """Test last page of multi-page content."""
-        content = "A" * 250  # 250 chars
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=3)
-
-        assert len(text) == 50  # Remaining 50 chars
-        assert not text.endswith("...")
-        assert total_pages == 3
-        assert has_next is False
-
-    def test_exact_page_boundary(self):
-        """Test content that exactly fills pages."""
-        content = "A" * 200  # Exactly 2 pages of 100 chars
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=1)
-
-        assert len(text) == 103  # 100 chars + "..."
-        assert total_pages == 2
-        assert has_next is True
-
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=2)
-        assert len(text) == 100  # Exactly 100 chars
-        assert total_pages == 2
-        assert has_next is False
-
-    def test_page_out_of_range(self):
-        """Test requesting page beyond available pages."""
-        content = "A" * 100
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=5)
-
-        assert text == ""
-        assert total_pages == 1
-        assert has_next is False
-
-    def test_invalid_page_number(self):
-        """Test with invalid page number (< 1)."""
-        with pytest.raises(ValueError, match="Page number must be 1 or greater"):
-            paginate_content("test content", max_chars=100, page=0)
-
-        with pytest.raises(ValueError, match="Page number must be 1 or greater"):
-            paginate_content("test content", max_chars=100, page=-1)
-
-    def test_invalid_max_chars(self):
-        """Test with invalid max_chars (< 1)."""
-        with pytest.raises(ValueError, match="max_chars must be positive"):
-            paginate_content("test content", max_chars=0, page=1)
-
-        with pytest.raises(ValueError, match="max_chars must be positive"):
-            paginate_content("test content", max_chars=-10, page=1)
-
-    def test_default_max_chars(self):
-        """Test with default max_chars parameter."""
-        content = "A" * 10000  # Large content
-        text, total_pages, has_next = paginate_content(content, max_chars=5000, page=1)
-
-        assert len(text) == 5003  # 5000 + "..."
-        assert total_pages == 2
-        assert has_next is True
+    @pytest.mark.parametrize(
+        ("max_chars", "page", "match"),
+        [
+            pytest.param(100, 0, PAGE_ERROR_RE, id="page_zero"),
+            pytest.param(100, -1, PAGE_ERROR_RE, id="page_negative"),
+            pytest.param(0, 1, MAX_CHARS_ERROR_RE, id="max_chars_zero"),
+            pytest.param(-10, 1, MAX_CHARS_ERROR_RE, id="max_chars_negative"),
+        ],
+    )
+    def test_invalid_arguments(self, max_chars, page, match):
+        """Test with invalid page number or max_chars (< 1)."""
+        with pytest.raises(ValueError, match=match):
+            paginate_content("test content", max_chars=max_chars, page=page)
 
     def test_unicode_content(self):
         """Test pagination with unicode content."""
-        content = "Привет мир! " * 50  # Unicode text
-        text, total_pages, has_next = paginate_content(content, max_chars=100, page=1)
+        text, total_pages, has_next = paginate_content(
+            UNICODE_CONTENT, max_chars=100, page=1
+        )
 
         assert len(text) <= 103  # Should not exceed max_chars + "..."
         assert total_pages > 0
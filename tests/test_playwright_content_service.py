@@ -1,14 +1,22 @@
 """Unit tests for PlaywrightWebpageContentService."""
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from web_explorer_mcp.config.settings import PlaywrightSettings
 from web_explorer_mcp.integrations.web.playwright_content_service import (
     PlaywrightWebpageContentService,
 )
-from web_explorer_mcp.models.entities import WebpageContent
+from web_explorer_mcp.models.entities import (
+    WebpageContent,
+    WebpageHeading,
+    WebpageImage,
+    WebpageLink,
+)
 
 
 class TestPlaywrightWebpageContentService:
@@ -24,6 +32,30 @@ class TestPlaywrightWebpageContentService:
         """Create service instance for testing."""
         return PlaywrightWebpageContentService(settings)
 
+    @pytest.fixture
+    async def static_service(self):
+        """
+        Build services whose static fetches go to an in-memory transport.
+
+        Call it with an httpx handler and optionally settings; every service
+        it creates is stopped after the test, even if an assertion failed.
+        """
+        services = []
+
+        def make(handler, settings=None):
+            service = PlaywrightWebpageContentService(settings or PlaywrightSettings())
+            service._http_client = httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            )
+            services.append(service)
+            return service
+
+        try:
+            yield make
+        finally:
+            for service in services:
+                await service.stop()
+
     @pytest.mark.asyncio
     async def test_invalid_url(self, service):
         """Test handling of invalid URL."""
@@ -37,19 +69,15 @@ class TestPlaywrightWebpageContentService:
     @pytest.mark.asyncio
     async def test_playwright_error_handling(self, service):
         """Test error handling when Playwright fails."""
+        # Children of an AsyncMock are AsyncMocks already, so only the return
+        # values and the failing goto need configuring
         mock_page = AsyncMock()
-        mock_page.add_init_script = AsyncMock()
-        mock_page.goto = AsyncMock(side_effect=Exception("Browser error"))
-        mock_page.close = AsyncMock()
-
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        mock_browser = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
+        mock_page.goto.side_effect = Exception("Browser error")
+        mock_page.is_closed = MagicMock(return_value=False)
 
         mock_playwright = AsyncMock()
-        mock_playwright.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_browser = mock_playwright.chromium.connect.return_value
+        mock_browser.new_context.return_value.new_page.return_value = mock_page
 
         with patch(
             "web_explorer_mcp.integrations.web.playwright_content_service.async_playwright"
@@ -65,3 +93,467 @@ class TestPlaywrightWebpageContentService:
             assert result.error is not None
             assert "Playwright extraction error" in result.error
             assert result.main_content == ""
+            mock_page.close.assert_awaited_once()
+
+    def test_parse_html_uses_lxml(self, service, sample_html):
+        """Test that HTML is parsed with the lxml tree builder."""
+        soup = service._parse_html(sample_html)
+
+        assert soup.builder.NAME == "lxml"
+        assert soup.title.string == "Test Page Title"
+
+    def test_parse_html_falls_back_to_html_parser(self, service, sample_html):
+        """Test fallback to html.parser when lxml parsing fails."""
+        from bs4 import BeautifulSoup
+
+        def fake_soup(markup, features):
+            if features == "lxml":
+                raise ValueError("lxml failure")
+            return BeautifulSoup(markup, features)
+
+        with patch(
+            "web_explorer_mcp.integrations.web.playwright_content_service.BeautifulSoup",
+            side_effect=fake_soup,
+        ):
+            soup = service._parse_html(sample_html)
+
+        assert soup.builder.NAME == "html.parser"
+        assert soup.title.string == "Test Page Title"
+
+    def test_extract_pagination_page_of_pattern(self, service):
+        """Test that 'Page X of Y' text sets current and total pages."""
+        soup = service._parse_html(
+            '<div class="pagination"><span>Page 2 of 7</span>'
+            '<a href="/p/3">Next</a></div>'
+        )
+
+        pagination = service._extract_pagination_info(soup, "https://example.com/p/2")
+
+        assert pagination["has_pagination"] is True
+        assert pagination["current_page"] == 2
+        assert pagination["total_pages"] == 7
+        assert pagination["next_page"] == "https://example.com/p/3"
+
+    def test_extract_structure_single_pass(self, service):
+        """Test that links, images and headings are collected together."""
+        soup = service._parse_html(
+            "<div><h1>Title</h1><a href='/a'>A</a><a href='/a'>dup</a>"
+            "<a href='#top'>skip</a><img src='/i.png' alt='Alt'>"
+            "<h3>Sub</h3><a href='https://github.com/x'>X</a></div>"
+        )
+
+        links, images, headings = service._extract_structure(
+            soup.div, "https://example.com/"
+        )
+
+        assert links == [
+            WebpageLink(url="https://example.com/a", text="A", type="external"),
+            WebpageLink(url="https://github.com/x", text="X", type="code"),
+        ]
+        assert images == [WebpageImage(url="https://example.com/i.png", alt="Alt")]
+        assert headings == [
+            WebpageHeading(level=1, text="Title"),
+            WebpageHeading(level=3, text="Sub"),
+        ]
+
+    def test_prune_html_drops_non_content_nodes(self, service):
+        """Test that scripts, styles, templates and comments are pruned."""
+        html = (
+            "<html><head><style>p{}</style><script>var x=1;</script></head>"
+            "<body><!-- note --><template><p>hidden</p></template>"
+            "<p>Visible text</p></body></html>"
+        )
+
+        pruned = service._prune_html(html)
+
+        assert "Visible text" in pruned
+        for fragment in ("<script", "<style", "<template", "note", "hidden"):
+            assert fragment not in pruned
+
+    def test_prune_html_returns_original_on_unparseable_input(self, service):
+        """Test that pruning leaves input lxml cannot parse untouched."""
+        assert service._prune_html("") == ""
+
+    @pytest.mark.asyncio
+    async def test_is_challenge_page(self, service):
+        """Test challenge detection from the lightweight page probe."""
+        page = AsyncMock()
+
+        page.evaluate = AsyncMock(return_value="just a moment... cloudflare")
+        assert await service._is_challenge_page(page) is True
+
+        page.evaluate = AsyncMock(return_value="example domain")
+        assert await service._is_challenge_page(page) is False
+
+        page.evaluate = AsyncMock(side_effect=Exception("page closed"))
+        assert await service._is_challenge_page(page) is False
+        page.content.assert_not_called()
+
+    def test_extract_structure_respects_item_cap(self):
+        """Test that collected links, images and headings are capped."""
+        from bs4 import BeautifulSoup
+
+        service = PlaywrightWebpageContentService(
+            PlaywrightSettings(max_structure_items=2)
+        )
+        html = "<div>" + "".join(
+            f'<h2>H{i}</h2><a href="/l{i}">L{i}</a><img src="/i{i}.png">'
+            for i in range(5)
+        )
+        soup = BeautifulSoup(html + "</div>", "lxml")
+
+        links, images, headings = service._extract_structure(
+            soup.div, "https://example.com"
+        )
+
+        assert [link.url for link in links] == [
+            "https://example.com/l0",
+            "https://example.com/l1",
+        ]
+        assert len(images) == 2
+        assert [h.text for h in headings] == ["H0", "H1"]
+
+    def test_process_html_populates_result(self, service, sample_html):
+        """Test that the synchronous processing step fills the result fields."""
+        result = WebpageContent(url="https://example.com")
+
+        service._process_html(sample_html, "https://example.com", {}, result)
+
+        assert result.title == "Test Page Title"
+        assert result.description == "Test page description"
+        assert "content inside an article" in result.main_content
+        assert result.length == len(result.main_content)
+        assert result.content_type == "article"
+
+    def test_clean_html_picks_strategy_from_html_size(self, service):
+        """Test that the cleaning strategy uses the given size, not str(soup)."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup("<div><p>text</p></div>", "lxml")
+        threshold = service.settings.large_page_threshold_bytes
+
+        with (
+            patch.object(service, "_clean_html_fast", return_value=soup) as fast,
+            patch.object(service, "_clean_html_thorough", return_value=soup) as slow,
+        ):
+            service._clean_html(soup, threshold + 1)
+            service._clean_html(soup, threshold)
+
+        fast.assert_called_once_with(soup)
+        slow.assert_called_once_with(soup)
+
+    def test_extract_text_content_normalizes_whitespace(self, service):
+        """Test whitespace folding with and without paragraph breaks."""
+        from bs4 import BeautifulSoup
+
+        single = BeautifulSoup("<div><p>one \t two</p><p>three</p></div>", "lxml")
+        multi = BeautifulSoup("<div><pre>one  two\n\n \nthree</pre></div>", "lxml")
+
+        base = "https://example.com"
+        assert service._extract_text_content(single.div, base) == "one two three"
+        assert service._extract_text_content(multi.div, base) == "one two\n\nthree"
+
+    def test_clean_html_thorough_keeps_preserved_posts(self, service):
+        """Test combined remove pass skips preserved and already removed nodes."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(
+            "<body><nav><div class='menu'>Menu</div></nav>"
+            "<div class='sidebar'><div class='ad'>Ad</div></div>"
+            "<div class='topic-post'><div class='reply'><footer>Reply footer"
+            "</footer></div></div><main><p>Body text</p></main></body>",
+            "lxml",
+        )
+
+        text = service._clean_html_thorough(soup).get_text(" ", strip=True)
+
+        assert text == "Reply footer Body text"
+
+    def test_find_main_content_uses_selector_priority(self, service):
+        """Test that compiled content selectors keep their priority order."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(
+            "<body><div id='content'>Fallback</div><main>Main area</main></body>",
+            "lxml",
+        )
+
+        assert service._find_main_content(soup).name == "main"
+
+    def test_find_main_content_discourse_common_parent(self, service):
+        """Test that the closest container holding every post is returned."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(
+            "<body><main><div id='stream'>"
+            "<div><article id='post_1'>First</article></div>"
+            "<article id='post_2'>Second</article>"
+            "<section><div><article id='post_3'>Third</article></div></section>"
+            "</div></main></body>",
+            "lxml",
+        )
+
+        assert service._find_main_content(soup).get("id") == "stream"
+
+    def test_find_main_content_keeps_outermost_block_on_equal_length(self, service):
+        """Test that nested blocks with the same text length pick the outer one."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(
+            f"<body><div id='outer'><section id='inner'>{'x' * 300}</section></div></body>",
+            "lxml",
+        )
+
+        assert service._find_main_content(soup).get("id") == "outer"
+
+    def test_inspect_static_html(self, service):
+        """Test the heuristic deciding whether a page needs JavaScript."""
+        article = (
+            "<html><head><title>Doc</title>"
+            "<meta property='og:title' content='OG Doc'></head>"
+            f"<body><p>{'word ' * 200}</p></body></html>"
+        )
+        spa_shell = (
+            "<html><body><div id='root'></div><noscript>Please enable "
+            f"JavaScript {'to continue ' * 100}</noscript>"
+            "<script>window.__NEXT_DATA__ = {}</script></body></html>"
+        )
+        challenge = (
+            "<html><head><title>Just a moment...</title></head>"
+            f"<body><p>{'word ' * 200}</p></body></html>"
+        )
+
+        assert service._inspect_static_html(article) == {
+            "meta": {"og:title": "OG Doc"},
+            "jsonLd": [],
+        }
+        assert service._inspect_static_html(spa_shell) is None
+        assert service._inspect_static_html(challenge) is None
+
+    @pytest.mark.asyncio
+    async def test_static_fetch_skips_browser(self, static_service, sample_html):
+        """Test that static pages are extracted without opening a browser page."""
+        service = static_service(
+            lambda request: httpx.Response(
+                200, html=sample_html, headers={"content-type": "text/html"}
+            ),
+            PlaywrightSettings(
+                static_fetch_enabled=True, static_fetch_min_text_chars=50
+            ),
+        )
+
+        with patch.object(service, "_get_page") as get_page:
+            result = await service.extract_content("https://example.com")
+
+        get_page.assert_not_called()
+        assert result.error is None
+        assert result.title == "Test Page Title"
+        assert "content inside an article" in result.main_content
+
+    @pytest.mark.asyncio
+    async def test_released_page_is_reused(self, service):
+        """Test that a released page is handed out again instead of a new one."""
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.goto = AsyncMock()
+        page.close = AsyncMock()
+        service._context = MagicMock()
+        service._context.new_page = AsyncMock(return_value=page)
+
+        with patch.object(service, "_ensure_browser", AsyncMock()):
+            first = await service._get_page()
+            await service._release_page(first)
+            second = await service._get_page()
+
+        assert second is first
+        service._context.new_page.assert_awaited_once()
+        page.goto.assert_awaited_once_with("about:blank")
+        page.close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_failed_page_is_closed(self, service):
+        """Test that a page from a failed extraction is closed, not pooled."""
+        page = MagicMock()
+        page.is_closed.return_value = False
+        page.close = AsyncMock()
+        service._context = MagicMock()
+
+        await service._release_page(page, reusable=False)
+
+        page.close.assert_awaited_once()
+        assert service._idle_pages == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("resource_type", "aborted"),
+        [("image", True), ("font", True), ("document", False), ("script", False)],
+    )
+    async def test_route_request_blocks_unneeded_resources(
+        self, service, resource_type, aborted
+    ):
+        """Test that only resources not needed for extraction are aborted."""
+        route = MagicMock()
+        route.request.resource_type = resource_type
+        route.abort = AsyncMock()
+        route.continue_ = AsyncMock()
+
+        await service._route_request(route)
+
+        assert route.abort.await_count == int(aborted)
+        assert route.continue_.await_count == int(not aborted)
+
+    @pytest.mark.asyncio
+    async def test_static_fetch_skips_hosts_that_need_browser(self, static_service):
+        """Test that a host needing JavaScript is not fetched statically again."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(
+                200,
+                html="<html><body><div id='app'></div></body></html>",
+                headers={"content-type": "text/html"},
+            )
+
+        service = static_service(handler, PlaywrightSettings(static_fetch_enabled=True))
+
+        assert await service._fetch_static("https://spa.example/a", 5) is None
+        assert await service._fetch_static("https://spa.example/b", 5) is None
+
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_render_gets_timeout_left_after_static_fetch(self, service):
+        """Test that a failed static fetch and the render share one timeout."""
+        service.settings.static_fetch_enabled = True
+
+        async def slow_static_fetch(url, timeout):
+            await asyncio.sleep(0.2)
+
+        with (
+            patch.object(service, "_fetch_static", side_effect=slow_static_fetch),
+            patch.object(service, "_get_page", new_callable=AsyncMock),
+            patch.object(service, "_release_page", new_callable=AsyncMock),
+            patch.object(
+                service, "_render_page", new_callable=AsyncMock, return_value=""
+            ) as render_page,
+        ):
+            await service.extract_content("https://example.com", raw_content=True)
+
+        render_timeout = render_page.await_args.args[2]
+        assert 0 < render_timeout <= 30 - 0.2
+
+    @pytest.mark.asyncio
+    async def test_static_fetch_using_whole_timeout_skips_render(self, service):
+        """Test that no render starts once the static fetch used the timeout."""
+        service.settings.static_fetch_enabled = True
+
+        async def slow_static_fetch(url, timeout):
+            await asyncio.sleep(timeout + 0.05)
+
+        with (
+            patch.object(service, "_fetch_static", side_effect=slow_static_fetch),
+            patch.object(service, "_get_page") as get_page,
+        ):
+            result = await service.extract_content("https://example.com", timeout=0.1)
+
+        get_page.assert_not_called()
+        assert "Static fetch used the whole 0.1s timeout" in result.error
+
+    def test_browser_hosts_are_bounded(self, service):
+        """Test that remembered hosts expire and are capped in number."""
+        from web_explorer_mcp.integrations.web import playwright_content_service
+
+        service._browser_hosts["stale.example"] = (
+            time.monotonic() - playwright_content_service._BROWSER_HOST_TTL_SECONDS - 1
+        )
+        with patch.object(playwright_content_service, "_BROWSER_HOSTS_MAX_ENTRIES", 3):
+            for i in range(5):
+                service._remember_browser_host(f"h{i}.example")
+
+        assert list(service._browser_hosts) == [
+            "h2.example",
+            "h3.example",
+            "h4.example",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("status", "content_type"),
+        [(404, "text/html"), (503, "text/html"), (200, "application/pdf")],
+    )
+    async def test_static_fetch_failure_does_not_mark_host(
+        self, static_service, status, content_type
+    ):
+        """Test that an error status or non-HTML response only affects that URL."""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url)
+            return httpx.Response(
+                status, content=b"%PDF", headers={"content-type": content_type}
+            )
+
+        service = static_service(handler, PlaywrightSettings(static_fetch_enabled=True))
+
+        assert await service._fetch_static("https://docs.example/a", 5) is None
+        assert await service._fetch_static("https://docs.example/b", 5) is None
+
+        assert len(requests) == 2
+        assert service._browser_hosts == {}
+
+    @pytest.mark.asyncio
+    async def test_render_false_uses_served_html_without_browser(self, static_service):
+        """Test that render=False extracts the served HTML even if it looks JS-only."""
+        html = (
+            "<html><head><title>Shell</title>"
+            "<meta name='description' content='Served description'></head>"
+            "<body><main><p>Short server-rendered text.</p></main></body></html>"
+        )
+        service = static_service(
+            lambda request: httpx.Response(
+                200, html=html, headers={"content-type": "text/html"}
+            )
+        )
+
+        with patch.object(service, "_get_page") as get_page:
+            result = await service.extract_content("https://example.com", render=False)
+
+        get_page.assert_not_called()
+        assert result.error is None
+        assert result.title == "Shell"
+        assert result.description == "Served description"
+        assert "server-rendered text" in result.main_content
+
+    @pytest.mark.asyncio
+    async def test_render_false_reports_http_errors(self, static_service):
+        """Test that render=False reports HTTP errors instead of opening a browser."""
+        service = static_service(lambda request: httpx.Response(404))
+
+        with patch.object(service, "_get_page") as get_page:
+            result = await service.extract_content("https://example.com", render=False)
+
+        get_page.assert_not_called()
+        assert result.error == "HTTP error fetching page: 404"
+
+    @pytest.mark.asyncio
+    async def test_render_false_rejects_non_html(self, static_service):
+        """Test that render=False reports binary responses instead of extracting them."""
+        service = static_service(
+            lambda request: httpx.Response(
+                200,
+                content=b"%PDF-1.7 binary",
+                headers={"content-type": "application/pdf"},
+            )
+        )
+
+        with patch.object(service, "_get_page") as get_page:
+            result = await service.extract_content(
+                "https://example.com/doc.pdf", render=False
+            )
+
+        get_page.assert_not_called()
+        assert (
+            result.error == "Unsupported content type for extraction: application/pdf"
+        )
+        assert result.main_content == ""
@@ -0,0 +1,188 @@
+"""Unit tests for SearxngWebSearchService."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from web_explorer_mcp.integrations.web.searxng_search_service import (
+    SearxngWebSearchService,
+)
+
+
+class TestSearxngWebSearchService:
+    """Unit tests for SearxngWebSearchService."""
+
+    @pytest.fixture
+    async def service(self):
+        """Create service instance and close its client afterwards."""
+        service = SearxngWebSearchService("http://searxng.test")
+        yield service
+        await service.stop()
+
+    @pytest.fixture
+    def searxng(self, service):
+        """
+        Route the service's client through an in-memory SearxNG transport.
+
+        Tests set ``searxng.handler`` to a function returning an
+        httpx.Response (or raising an httpx error); every request the service
+        sends is recorded in ``searxng.requests``.
+        """
+
+        class FakeSearxng:
+            def __init__(self):
+                self.requests: list[httpx.Request] = []
+                self.handler = lambda request: httpx.Response(200, json={"results": []})
+
+            def __call__(self, request: httpx.Request) -> httpx.Response:
+                self.requests.append(request)
+                # The handler may be async; MockTransport awaits what it returns
+                return self.handler(request)
+
+        fake = FakeSearxng()
+        service._client = httpx.AsyncClient(transport=httpx.MockTransport(fake))
+        return fake
+
+    @pytest.mark.asyncio
+    async def test_search_sends_query_and_page(self, service, searxng):
+        """Test that the stripped query and page are sent to the search endpoint."""
+        await service.search("  python asyncio ", page=3)
+
+        (request,) = searxng.requests
+        assert request.url.path == "/search"
+        assert dict(request.url.params) == {
+            "q": "python asyncio",
+            "format": "json",
+            "pageno": "3",
+        }
+
+    @pytest.mark.asyncio
+    async def test_results_are_trimmed_to_page_size(self, service, searxng):
+        """Test that SearxNG results are mapped and cut to page_size client-side."""
+        searxng.handler = lambda request: httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"title": f"T{i}", "content": f"C{i}", "url": f"https://r{i}.test"}
+                    for i in range(4)
+                ]
+            },
+        )
+
+        result = await service.search("python", page_size=2)
+
+        assert result.error is None
+        assert result.total_results == 4
+        assert [(r.title, r.description, r.url) for r in result.results] == [
+            ("T0", "C0", "https://r0.test"),
+            ("T1", "C1", "https://r1.test"),
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("kwargs", "error"),
+        [
+            ({"query": ""}, "Search query must be a non-empty string"),
+            ({"query": "   "}, "Search query must be a non-empty string"),
+            ({"query": "python", "page": 0}, "Page number must be greater than 0"),
+            ({"query": "python", "page_size": 0}, "Page size must be greater than 0"),
+        ],
+    )
+    async def test_invalid_input_skips_request(self, service, searxng, kwargs, error):
+        """Test that invalid arguments return an error without calling SearxNG."""
+        result = await service.search(**kwargs)
+
+        assert result.error == error
+        assert result.results == []
+        assert searxng.requests == []
+
+    @pytest.mark.asyncio
+    async def test_http_error_status_is_reported(self, service, searxng):
+        """Test that an error status from SearxNG becomes the result error."""
+        searxng.handler = lambda request: httpx.Response(503)
+
+        result = await service.search("python")
+
+        assert result.error == "HTTP error from SearxNG: 503"
+        assert result.results == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("exc", "error"),
+        [
+            (
+                httpx.ConnectError("refused"),
+                "Cannot connect to SearxNG (http://searxng.test). Make sure the service is running.",
+            ),
+            (httpx.ReadTimeout("slow"), "Request timeout after 15 seconds"),
+        ],
+    )
+    async def test_transport_errors_are_reported(self, service, searxng, exc, error):
+        """Test that connection failures and timeouts become the result error."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise exc
+
+        searxng.handler = handler
+
+        result = await service.search("python")
+
+        assert result.error == error
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_across_searches(self, service, searxng):
+        """Test that consecutive searches share one HTTP client."""
+        clients = []
+
+        for _ in range(2):
+            result = await service.search("python")
+            assert result.error is None
+            clients.append(service._get_client())
+
+        assert clients[0] is clients[1]
+
+    @pytest.mark.asyncio
+    async def test_stop_closes_client(self, service):
+        """Test that stop() closes the shared client and a new one is created later."""
+        client = service._get_client()
+
+        await service.stop()
+
+        assert client.is_closed
+        assert service._client is None
+        assert service._get_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_searches_share_one_request(
+        self, service, searxng
+    ):
+        """Test that concurrent searches for the same query and page are coalesced."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.01)
+            results = [
+                {"title": f"T{i}", "content": "", "url": f"https://r{i}.test"}
+                for i in range(3)
+            ]
+            return httpx.Response(200, json={"results": results})
+
+        searxng.handler = handler
+
+        first, second, other = await asyncio.gather(
+            service.search("python", page_size=1),
+            service.search(" python ", page_size=3),
+            service.search("rust"),
+        )
+
+        requests = [r.url.params["q"] for r in searxng.requests]
+        assert sorted(requests) == ["python", "rust"]
+        assert [r.url for r in first.results] == ["https://r0.test"]
+        assert len(second.results) == 3
+        assert first.total_results == second.total_results == 3
+        assert other.error is None
+        assert service._in_flight == {}
+
+        # Once the request has finished, a new search goes to SearxNG again
+        await service.search("python")
+        assert [r.url.params["q"] for r in searxng.requests].count("python") == 2
@@ -4,7 +4,6 @@ from unittest.mock import patch
 
 import pytest
 
-from web_explorer_mcp.config.settings import AppSettings
 from web_explorer_mcp.entrypoints.mcp.server import mcp
 from web_explorer_mcp.models.entities import (
     SearchResponse,
@@ -16,9 +15,10 @@ from web_explorer_mcp.models.entities import (
 class TestMCPServer:
     """Integration and unit tests for MCP server tools."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.settings = AppSettings()
+    @pytest.fixture(autouse=True)
+    def _use_app_settings(self, app_settings):
+        """Expose the session-wide settings to the tests as self.settings."""
+        self.settings = app_settings
 
     def test_web_search_tool_logic(self):
         """Test web_search_tool logic with successful search."""
@@ -74,9 +74,8 @@ class TestMCPServer:
         assert self.settings.logging.console_log_level is not None
         assert self.settings.logging.file_log_level is not None
 
-    @pytest.mark.asyncio
     @patch("web_explorer_mcp.entrypoints.mcp.server.web_explorer_service")
-    async def test_web_search_tool_conversion_success(self, mock_service):
+    def test_web_search_tool_conversion_success(self, mock_service):
         """Test web_search_tool response conversion with successful search."""
         # Setup mock response with proper SearchResult objects
         mock_response = SearchResponse(
@@ -97,21 +96,7 @@ class TestMCPServer:
         mock_service.search_web.return_value = mock_response
 
         # Test the conversion that happens in the tool
-        converted = {
-            "query": mock_response.query,
-            "page": mock_response.page,
-            "page_size": mock_response.page_size,
-            "total_results": mock_response.total_results,
-            "results": [
-                {
-                    "title": r.title,
-                    "description": r.description,
-                    "url": r.url,
-                }
-                for r in mock_response.results
-            ],
-            "error": None,
-        }
+        converted = mock_response.model_dump()
 
         expected = {
             "query": "test query",
@@ -135,9 +120,8 @@ class TestMCPServer:
 
         assert converted == expected
 
-    @pytest.mark.asyncio
     @patch("web_explorer_mcp.entrypoints.mcp.server.web_explorer_service")
-    async def test_webpage_content_tool_conversion_success(self, mock_service):
+    def test_webpage_content_tool_conversion_success(self, mock_service):
         """Test webpage_content_tool response conversion with successful extraction."""
         from web_explorer_mcp.models.entities import WebpageHeading
 
@@ -168,9 +152,7 @@ class TestMCPServer:
             "description": mock_response.description,
             "main_content": mock_response.main_content,
             "main_text": paginated_text,
-            "headings": [
-                {"level": h.level, "text": h.text} for h in mock_response.headings
-            ],
+            "headings": [h.model_dump() for h in mock_response.headings],
             "length": display_length,
             "error": mock_response.error,
             "page": 1,
@@ -193,3 +175,133 @@ class TestMCPServer:
         }
 
         assert converted == expected
+
+    @pytest.mark.asyncio
+    @patch("web_explorer_mcp.entrypoints.mcp.server.web_explorer_service")
+    async def test_web_search_batch_tool(self, mock_service):
+        """Test that the batch search tool returns one result per query, in order."""
+        from unittest.mock import AsyncMock
+
+        from fastmcp import Client
+
+        mock_service.search_many_web = AsyncMock(
+            return_value=[
+                SearchResponse(
+                    query="a",
+                    page=1,
+                    page_size=2,
+                    total_results=1,
+                    results=[
+                        SearchResult(title="A", description="", url="https://a.example")
+                    ],
+                ),
+                SearchResponse(
+                    query="b", page=1, page_size=2, total_results=0, error="Timeout"
+                ),
+            ]
+        )
+
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "web_search_batch_tool", {"queries": ["a", "b"], "page_size": 2}
+            )
+
+        mock_service.search_many_web.assert_awaited_once_with(
+            queries=["a", "b"], page=1, page_size=2
+        )
+        first, second = result.data["results"]
+        assert first["query"] == "a"
+        assert first["results"][0]["url"] == "https://a.example"
+        assert first["error"] is None
+        assert second == {
+            "query": "b",
+            "page": 1,
+            "page_size": 2,
+            "total_results": 0,
+            "results": [],
+            "error": "Timeout",
+        }
+        assert result.data["error"] is None
+
+    @pytest.mark.asyncio
+    @patch("web_explorer_mcp.entrypoints.mcp.server.web_explorer_service")
+    async def test_web_search_batch_tool_rejects_too_many_queries(self, mock_service):
+        """Test that a batch above the configured query limit is rejected unsearched."""
+        from unittest.mock import AsyncMock
+
+        from fastmcp import Client
+
+        mock_service.search_many_web = AsyncMock()
+        limit = self.settings.web_search.max_batch_queries
+        queries = [f"query {i}" for i in range(limit + 1)]
+
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "web_search_batch_tool", {"queries": queries}
+            )
+
+        mock_service.search_many_web.assert_not_awaited()
+        assert result.data["results"] == []
+        assert result.data["error"] == (
+            f"Too many queries: {len(queries)} given, at most {limit} allowed per call"
+        )
+
+    @pytest.mark.asyncio
+    @patch("web_explorer_mcp.entrypoints.mcp.server.web_explorer_service")
+    async def test_webpage_content_batch_tool(self, mock_service):
+        """Test that the batch tool returns one paginated result per URL, in order."""
+        from unittest.mock import AsyncMock
+
+        from fastmcp import Client
+
+        mock_service.extract_many_webpage_contents = AsyncMock(
+            return_value=[
+                WebpageContent(url="https://a.example", main_content="A" * 30),
+                WebpageContent(url="https://b.example", error="Extraction error: x"),
+            ]
+        )
+
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "webpage_content_batch_tool",
+                {"urls": ["https://a.example", "https://b.example"], "max_chars": 10},
+            )
+
+        mock_service.extract_many_webpage_contents.assert_awaited_once_with(
+            urls=["https://a.example", "https://b.example"],
+            raw_content=False,
+            render=True,
+        )
+        first, second = result.data["results"]
+        assert first["url"] == "https://a.example"
+        assert first["main_text"].startswith("A" * 10)
+        assert first["total_pages"] == 3
+        assert second["url"] == "https://b.example"
+        assert second["error"] == "Extraction error: x"
+        assert result.data["error"] is None
+
+    @pytest.mark.asyncio
+    @patch("web_explorer_mcp.entrypoints.mcp.server.web_explorer_service")
+    async def test_webpage_content_batch_tool_rejects_too_many_urls(self, mock_service):
+        """Test that a batch above the configured URL limit is rejected unextracted."""
+        from unittest.mock import AsyncMock
+
+        from fastmcp import Client
+
+        mock_service.extract_many_webpage_contents = AsyncMock()
+        urls = [
+            f"https://example.com/{i}"
+            for i in range(self.settings.webpage.max_batch_urls + 1)
+        ]
+
+        async with Client(mcp) as client:
+            result = await client.call_tool(
+                "webpage_content_batch_tool", {"urls": urls}
+            )
+
+        mock_service.extract_many_webpage_contents.assert_not_awaited()
+        assert result.data["results"] == []
+        assert result.data["error"] == (
+            f"Too many URLs: {len(urls)} given, "
+            f"at most {self.settings.webpage.max_batch_urls} allowed per call"
+        )
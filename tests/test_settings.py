@@ -12,9 +12,9 @@ from web_explorer_mcp.config.settings import (
 class TestSettings:
     """Unit tests for settings configuration."""
 
-    def test_default_settings(self):
+    def test_default_settings(self, app_settings):
         """Test default settings values."""
-        settings = AppSettings()
+        settings = app_settings
 
         # Test debug
         assert settings.debug is False
@@ -47,15 +47,14 @@ class TestSettings:
     )
     def test_environment_variable_override(self):
         """Test that environment variables override default settings."""
-        # Need to create settings after environment is set
-        from web_explorer_mcp.config.settings import AppSettings
-
-        settings = AppSettings()
+        # Created after the environment is patched; a local .env is ignored
+        settings = AppSettings(_env_file=None)
 
-        # Note: pydantic-settings may cache or not pick up env changes after import
-        # This test verifies the configuration mechanism exists
-        assert settings is not None
-        assert hasattr(settings, "debug")
+        assert settings.debug is True
+        assert settings.logging.console_log_level == "DEBUG"
+        assert settings.web_search.searxng_url == "http://custom-searxng:8080"
+        assert settings.web_search.default_page_size == 10
+        assert settings.webpage.max_chars == 3000
 
     @patch.dict(
         os.environ,
@@ -70,15 +69,16 @@ class TestSettings:
     )
     def test_nested_environment_variables(self):
         """Test nested environment variable configuration."""
-        # Need to create settings after environment is set
-        from web_explorer_mcp.config.settings import AppSettings
-
-        settings = AppSettings()
-
-        # Note: pydantic-settings may cache or not pick up env changes after import
-        # This test verifies the configuration mechanism exists
-        assert settings is not None
-        assert hasattr(settings.logging, "file_log_level")
+        # Created after the environment is patched; a local .env is ignored
+        settings = AppSettings(_env_file=None)
+
+        assert settings.logging.file_log_level == "ERROR"
+        assert settings.logging.log_file_path == "/var/log/app.log"
+        assert settings.logging.log_file_format == "json"
+        assert settings.web_search.timeout == 30
+        assert settings.webpage.timeout == 20
+        # Fields not set in the environment keep their defaults
+        assert settings.logging.console_log_level == "INFO"
 
     def test_logging_settings_model(self):
         """Test LoggingSettings model creation and validation."""
@@ -139,32 +139,27 @@ class TestSettings:
         settings = LoggingSettings(log_file_format="invalid")
         assert settings.log_file_format == "invalid"  # No validation at model level
 
-    def test_settings_with_env_file(self):
+    def test_settings_with_env_file(self, app_settings):
         """Test loading settings from .env file."""
         # This test assumes a .env file exists, but since we're in a test environment,
         # we'll just verify the settings can be created without env file
-        settings = AppSettings()
-        assert settings is not None
+        assert app_settings is not None
 
-    def test_settings_config_dict(self):
+    def test_settings_config_dict(self, app_settings):
         """Test that SettingsConfigDict is properly configured."""
-        settings = AppSettings()
+        config = app_settings.model_config
 
-        # Verify that the model has the expected config
-        config = settings.model_config
-
-        # Check that config contains expected values
-        assert hasattr(config, "env_prefix") or "env_prefix" in config
-        assert (
-            hasattr(config, "env_nested_delimiter") or "env_nested_delimiter" in config
-        )
-        assert hasattr(config, "case_sensitive") or "case_sensitive" in config
-        assert hasattr(config, "extra") or "extra" in config
-        assert hasattr(config, "env_file") or "env_file" in config
-        assert hasattr(config, "env_file_encoding") or "env_file_encoding" in config
+        # The documented WEB_EXPLORER_MCP_<SECTION>_<FIELD> variable names
+        # depend on these values
+        assert config["env_prefix"] == "WEB_EXPLORER_MCP_"
+        assert config["env_nested_delimiter"] == "_"
+        assert config["env_nested_max_split"] == 1
+        assert config["case_sensitive"] is False
+        assert config["env_file"] == ".env"
 
     def test_settings_immutability(self):
         """Test that settings are immutable after creation."""
+        # Built here, not taken from the shared fixture, as the test mutates it
         settings = AppSettings()
 
         # Try to modify settings (should work as they're not frozen)
@@ -173,9 +168,9 @@ class TestSettings:
 
         assert settings.debug != original_debug
 
-    def test_settings_field_types(self):
+    def test_settings_field_types(self, app_settings):
         """Test that all settings fields have correct types."""
-        settings = AppSettings()
+        settings = app_settings
 
         # Test type annotations
         assert isinstance(settings.debug, bool)
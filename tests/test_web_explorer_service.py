@@ -1,11 +1,48 @@
 """Unit tests for WebExplorerService."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
-from web_explorer_mcp.business.services import WebExplorerService
-from web_explorer_mcp.models.entities import SearchResponse, WebpageContent
+from web_explorer_mcp.business.services import (
+    CachedWebpageContentService,
+    CachedWebSearchService,
+    WebExplorerService,
+)
+from web_explorer_mcp.models.entities import (
+    SearchResponse,
+    SearchResult,
+    WebpageContent,
+    WebpageLink,
+)
+
+# Default service responses, validated once; fixtures hand out copies so a
+# test that changes its response cannot leak into the next one
+DEFAULT_SEARCH_RESPONSE = SearchResponse(
+    query="test query",
+    page=1,
+    page_size=5,
+    total_results=10,
+    results=[],
+    error=None,
+)
+DEFAULT_CONTENT = WebpageContent(
+    url="https://example.com",
+    title="Test Page",
+    description="Test description",
+    author="Test Author",
+    published_date="2025-01-01",
+    main_content="Test content",
+    headings=[],
+    links=[],
+    images=[],
+    metadata={},
+    content_type="article",
+    pagination={},
+    length=100,
+    error=None,
+)
 
 
 class TestWebExplorerService:
@@ -15,36 +52,14 @@ class TestWebExplorerService:
     def mock_search_service(self):
         """Mock WebSearchService."""
         service = AsyncMock()
-        service.search.return_value = SearchResponse(
-            query="test query",
-            page=1,
-            page_size=5,
-            total_results=10,
-            results=[],
-            error=None,
-        )
+        service.search.return_value = DEFAULT_SEARCH_RESPONSE.model_copy(deep=True)
         return service
 
     @pytest.fixture
     def mock_content_service(self):
         """Mock WebpageContentService."""
         service = AsyncMock()
-        service.extract_content.return_value = WebpageContent(
-            url="https://example.com",
-            title="Test Page",
-            description="Test description",
-            author="Test Author",
-            published_date="2025-01-01",
-            main_content="Test content",
-            headings=[],
-            links=[],
-            images=[],
-            metadata={},
-            content_type="article",
-            pagination={},
-            length=100,
-            error=None,
-        )
+        service.extract_content.return_value = DEFAULT_CONTENT.model_copy(deep=True)
         return service
 
     @pytest.fixture
@@ -110,6 +125,7 @@ class TestWebExplorerService:
             url="https://example.com",
             raw_content=False,
             timeout=30,
+            render=True,
         )
 
     @pytest.mark.asyncio
@@ -128,6 +144,7 @@ class TestWebExplorerService:
             url="https://example.com",
             raw_content=True,
             timeout=60,
+            render=True,
         )
 
     @pytest.mark.asyncio
@@ -177,3 +194,407 @@ class TestWebExplorerService:
 
         assert result.error == "Extraction failed"
         assert result.url == "https://error.com"
+
+    @pytest.mark.asyncio
+    async def test_stop_stops_both_services(
+        self, web_explorer_service, mock_search_service, mock_content_service
+    ):
+        """Test that stop() releases resources of both services."""
+        await web_explorer_service.stop()
+
+        mock_search_service.stop.assert_awaited_once()
+        mock_content_service.stop.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_extract_many_webpage_contents_limits_per_host(
+        self, mock_search_service
+    ):
+        """Test batch extraction keeps order and bounds per-host concurrency."""
+        in_flight: dict[str, int] = {}
+        peak: dict[str, int] = {}
+
+        async def fake_extract(url, raw_content=False, timeout=30, render=True):
+            host = url.split("/")[2]
+            in_flight[host] = in_flight.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), in_flight[host])
+            await asyncio.sleep(0.01)
+            in_flight[host] -= 1
+            if url.endswith("/boom"):
+                raise RuntimeError("boom")
+            return WebpageContent(url=url)
+
+        content_service = AsyncMock()
+        content_service.extract_content.side_effect = fake_extract
+        service = WebExplorerService(
+            mock_search_service,
+            content_service,
+            max_concurrency=10,
+            max_concurrency_per_host=2,
+        )
+        urls = [f"https://a.com/{i}" for i in range(6)] + [
+            "https://b.com/1",
+            "https://b.com/boom",
+        ]
+
+        results = await service.extract_many_webpage_contents(urls)
+
+        assert [r.url for r in results] == urls
+        assert peak["a.com"] == 2
+        assert results[-1].error == "Extraction error: boom"
+        assert all(r.error is None for r in results[:-1])
+
+    @pytest.mark.asyncio
+    async def test_extract_many_host_limit_spans_concurrent_batches(
+        self, mock_search_service
+    ):
+        """Test that concurrent batches share one per-host limit."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(url, raw_content=False, timeout=30, render=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return WebpageContent(url=url)
+
+        content_service = AsyncMock()
+        content_service.extract_content.side_effect = fake_extract
+        service = WebExplorerService(
+            mock_search_service,
+            content_service,
+            max_concurrency=10,
+            max_concurrency_per_host=2,
+        )
+
+        await asyncio.gather(
+            service.extract_many_webpage_contents(
+                [f"https://a.com/x{i}" for i in range(4)]
+            ),
+            service.extract_many_webpage_contents(
+                [f"https://a.com/y{i}" for i in range(4)]
+            ),
+        )
+
+        assert peak == 2
+        assert len(service._host_semaphores) == 0
+
+    @pytest.mark.asyncio
+    async def test_extract_many_busy_host_does_not_delay_other_hosts(
+        self, mock_search_service
+    ):
+        """Test that URLs waiting on a saturated host leave global slots free."""
+        finished_at: dict[str, float] = {}
+        loop = asyncio.get_running_loop()
+
+        async def fake_extract(url, raw_content=False, timeout=30, render=True):
+            await asyncio.sleep(0.05)
+            finished_at[url] = loop.time()
+            return WebpageContent(url=url)
+
+        content_service = AsyncMock()
+        content_service.extract_content.side_effect = fake_extract
+        service = WebExplorerService(
+            mock_search_service,
+            content_service,
+            max_concurrency=10,
+            max_concurrency_per_host=4,
+        )
+        urls = [f"https://a.com/{i}" for i in range(10)] + ["https://b.com/1"]
+
+        started_at = loop.time()
+        await service.extract_many_webpage_contents(urls)
+
+        # b.com runs in the first round next to the first four a.com URLs
+        assert finished_at["https://b.com/1"] - started_at < 0.09
+
+    @pytest.mark.asyncio
+    async def test_search_many_web_bounds_concurrency(self, mock_content_service):
+        """Test batch search keeps order, bounds concurrency and isolates errors."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_search(query, page=1, page_size=5, timeout=15):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if query == "boom":
+                raise RuntimeError("boom")
+            return SearchResponse(
+                query=query, page=page, page_size=page_size, total_results=1
+            )
+
+        search_service = AsyncMock()
+        search_service.search.side_effect = fake_search
+        service = WebExplorerService(
+            search_service, mock_content_service, max_search_concurrency=2
+        )
+        queries = [f"query {i}" for i in range(5)] + ["boom"]
+
+        results = await service.search_many_web(queries, page=2, page_size=3)
+
+        assert [r.query for r in results] == queries
+        assert peak == 2
+        assert all(r.page == 2 and r.page_size == 3 for r in results)
+        assert results[-1].error == "Search error: boom"
+        assert all(r.error is None for r in results[:-1])
+
+
+class TestCachedWebpageContentService:
+    """Test cases for CachedWebpageContentService."""
+
+    @pytest.fixture
+    def inner_service(self):
+        """Mock WebpageContentService returning a fresh result per URL."""
+        service = AsyncMock()
+        service.extract_content.side_effect = (
+            lambda url, raw_content=False, timeout=30, favor_precision=True, render=True: (
+                WebpageContent(url=url, main_content=f"content of {url}")
+            )
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeated_url_is_served_from_cache(self, inner_service):
+        """Test that a second request for the same URL skips extraction."""
+        cache = CachedWebpageContentService(inner_service)
+
+        first = await cache.extract_content("https://example.com")
+        first.error = "modified by caller"
+        first.links.append(WebpageLink(url="https://added.example"))
+        first.metadata["added"] = True
+        second = await cache.extract_content("https://example.com")
+
+        assert inner_service.extract_content.await_count == 1
+        assert second.main_content == "content of https://example.com"
+        assert second.error is None
+        assert second.links == []
+        assert second.metadata == {}
+
+    @pytest.mark.asyncio
+    async def test_static_extraction_is_cached_separately(self, inner_service):
+        """Test that rendered and static results use different cache entries."""
+        cache = CachedWebpageContentService(inner_service)
+
+        await cache.extract_content("https://example.com")
+        await cache.extract_content("https://example.com", render=False)
+
+        assert inner_service.extract_content.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_raw_content_is_cached_separately(self, inner_service):
+        """Test that raw and processed results use different cache entries."""
+        cache = CachedWebpageContentService(inner_service)
+
+        await cache.extract_content("https://example.com")
+        await cache.extract_content("https://example.com", raw_content=True)
+
+        assert inner_service.extract_content.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, inner_service):
+        """Test that failed extractions are retried on the next call."""
+        inner_service.extract_content.side_effect = None
+        inner_service.extract_content.return_value = WebpageContent(
+            url="https://error.com", error="Extraction failed"
+        )
+        cache = CachedWebpageContentService(inner_service)
+
+        await cache.extract_content("https://error.com")
+        await cache.extract_content("https://error.com")
+
+        assert inner_service.extract_content.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, inner_service):
+        """Test that entries older than the TTL are extracted again."""
+        cache = CachedWebpageContentService(inner_service, ttl_seconds=0)
+
+        await cache.extract_content("https://example.com")
+        await cache.extract_content("https://example.com")
+
+        assert inner_service.extract_content.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, inner_service):
+        """Test that the cache evicts the least recently used URL."""
+        cache = CachedWebpageContentService(inner_service, max_entries=2)
+
+        await cache.extract_content("https://a.com")
+        await cache.extract_content("https://b.com")
+        await cache.extract_content("https://a.com")  # a becomes most recent
+        await cache.extract_content("https://c.com")  # evicts b
+        await cache.extract_content("https://a.com")
+        await cache.extract_content("https://b.com")
+
+        urls = [c.kwargs["url"] for c in inner_service.extract_content.await_args_list]
+        assert urls == [
+            "https://a.com",
+            "https://b.com",
+            "https://c.com",
+            "https://b.com",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_stop_clears_cache_and_stops_inner_service(self, inner_service):
+        """Test that stop() drops cached entries and stops the wrapped service."""
+        cache = CachedWebpageContentService(inner_service)
+        await cache.extract_content("https://example.com")
+
+        await cache.stop()
+        await cache.extract_content("https://example.com")
+
+        inner_service.stop.assert_awaited_once()
+        assert inner_service.extract_content.await_count == 2
+
+
+class TestCachedWebSearchService:
+    """Test cases for CachedWebSearchService."""
+
+    @pytest.fixture
+    def inner_service(self):
+        """Mock WebSearchService returning a fresh response per query."""
+        service = AsyncMock()
+        service.search.side_effect = lambda query, page=1, page_size=5, timeout=15: (
+            SearchResponse(
+                query=query,
+                page=page,
+                page_size=page_size,
+                total_results=1,
+                results=[
+                    SearchResult(title=query, description="", url="https://r.test")
+                ],
+            )
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_repeated_search_is_served_from_cache(self, inner_service):
+        """Test that a repeated search, up to whitespace, skips the backend."""
+        cache = CachedWebSearchService(inner_service)
+
+        first = await cache.search("python")
+        first.results.clear()
+        second = await cache.search("  python ")
+
+        assert inner_service.search.await_count == 1
+        assert [r.title for r in second.results] == ["python"]
+
+    @pytest.mark.asyncio
+    async def test_pages_are_cached_separately(self, inner_service):
+        """Test that other pages use their own cache entries."""
+        cache = CachedWebSearchService(inner_service)
+
+        await cache.search("python")
+        await cache.search("python", page=2)
+
+        assert inner_service.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_smaller_page_size_is_sliced_from_cache(self, inner_service):
+        """Test that fewer results are served from a larger cached search."""
+        inner_service.search.side_effect = None
+        inner_service.search.return_value = SearchResponse(
+            query="python",
+            page=1,
+            page_size=10,
+            total_results=20,
+            results=[
+                SearchResult(title=str(i), description="", url=f"https://r{i}.test")
+                for i in range(10)
+            ],
+        )
+        cache = CachedWebSearchService(inner_service)
+
+        await cache.search("python", page_size=10)
+        small = await cache.search("python", page_size=3)
+        small.results[0].title = "modified by caller"
+        again = await cache.search("python", page_size=10)
+
+        assert inner_service.search.await_count == 1
+        assert small.page_size == 3
+        assert small.total_results == 20
+        assert [r.title for r in again.results] == [str(i) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_larger_page_size_is_searched_again(self, inner_service):
+        """Test that asking for more results than cached goes to the backend."""
+        inner_service.search.side_effect = None
+        inner_service.search.return_value = SearchResponse(
+            query="python",
+            page=1,
+            page_size=3,
+            total_results=20,
+            results=[
+                SearchResult(title=str(i), description="", url=f"https://r{i}.test")
+                for i in range(3)
+            ],
+        )
+        cache = CachedWebSearchService(inner_service)
+
+        await cache.search("python", page_size=3)
+        await cache.search("python", page_size=10)
+
+        assert inner_service.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_complete_result_set_serves_any_page_size(self, inner_service):
+        """Test that a cached search holding every result serves larger sizes too."""
+        cache = CachedWebSearchService(inner_service)
+
+        await cache.search("python", page_size=5)  # backend has 1 result in total
+        result = await cache.search("python", page_size=50)
+
+        assert inner_service.search.await_count == 1
+        assert result.page_size == 50
+        assert len(result.results) == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, inner_service):
+        """Test that failed searches are retried on the next call."""
+        inner_service.search.side_effect = None
+        inner_service.search.return_value = SearchResponse(
+            query="python", page=1, page_size=5, total_results=0, error="Timeout"
+        )
+        cache = CachedWebSearchService(inner_service)
+
+        await cache.search("python")
+        await cache.search("python")
+
+        assert inner_service.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_refetched(self, inner_service):
+        """Test that entries older than the TTL are searched again."""
+        cache = CachedWebSearchService(inner_service, ttl_seconds=0)
+
+        await cache.search("python")
+        await cache.search("python")
+
+        assert inner_service.search.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self, inner_service):
+        """Test that the cache evicts the least recently used search."""
+        cache = CachedWebSearchService(inner_service, max_entries=2)
+
+        for query in ("a", "b", "a", "c", "a", "b"):
+            await cache.search(query)
+
+        queries = [c.kwargs["query"] for c in inner_service.search.await_args_list]
+        assert queries == ["a", "b", "c", "b"]
+
+    @pytest.mark.asyncio
+    async def test_stop_clears_cache_and_stops_inner_service(self, inner_service):
+        """Test that stop() drops cached entries and stops the wrapped service."""
+        cache = CachedWebSearchService(inner_service)
+        await cache.search("python")
+
+        await cache.stop()
+        await cache.search("python")
+
+        inner_service.stop.assert_awaited_once()
+        assert inner_service.search.await_count == 2
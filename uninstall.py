@@ -5,29 +5,58 @@ Removes all Docker containers, volumes, and cleans up the project
 """
 
 import os
+import shutil
+import stat
 import subprocess
 import sys
 from pathlib import Path
 
 
-def run_command(command: list[str], check: bool = True) -> subprocess.CompletedProcess:
-    """Run a shell command and return the result."""
+def run_command(
+    command: list[str], check: bool = True, stream: bool = True
+) -> subprocess.CompletedProcess:
+    """
+    Run a shell command and return the result.
+
+    With stream=True the command writes straight to the terminal, so its
+    progress is visible as it runs and nothing is buffered in memory; pass
+    stream=False to capture stdout/stderr on the result instead.
+    """
     try:
-        result = subprocess.run(
+        if stream:
+            return subprocess.run(command, check=check)
+        return subprocess.run(
             command,
             check=check,
             capture_output=True,
             text=True,
         )
-        return result
     except subprocess.CalledProcessError as e:
         print(f"Error running command: {' '.join(command)}")
-        print(f"Error: {e.stderr}")
+        if e.stderr:
+            print(f"Error: {e.stderr}")
         if check:
             sys.exit(1)
         return e
 
 
+def remove_tree(path: Path) -> None:
+    """
+    Remove a directory tree, clearing read-only flags that block deletion.
+
+    shutil.rmtree already walks the tree with os.scandir and file
+    descriptors; the handler only steps in for entries it could not delete
+    (read-only files are common in virtual environments on Windows), makes
+    them writable and retries once.
+    """
+
+    def make_writable_and_retry(func, entry, _exc):
+        os.chmod(entry, stat.S_IWRITE | stat.S_IREAD | stat.S_IEXEC)
+        func(entry)
+
+    shutil.rmtree(path, onexc=make_writable_and_retry)
+
+
 def main():
     """Main uninstallation routine."""
     print("=" * 50)
@@ -66,9 +95,7 @@ def main():
     if venv_dir.exists():
         print("\n3. Removing local Python virtual environment...")
         try:
-            import shutil
-
-            shutil.rmtree(venv_dir)
+            remove_tree(venv_dir)
             print("✓ Virtual environment removed")
         except Exception as e:
             print(f"⚠ Warning: Failed to remove virtual environment: {e}")